@@ -2,6 +2,10 @@
 玩家统计指标计算
 """
 
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from importlib.util import find_spec
 from typing import List, Dict, Optional
 from dataclasses import dataclass, field
 from collections import defaultdict
@@ -10,6 +14,52 @@ from ..models.hand import Hand
 from ..models.player import Player
 from ..models.action import Action, ActionType, Street
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# numba 的导入和编译都要几百毫秒，这里只检测是否安装，首次计算 AF 时再导入并编译
+NUMBA_AVAILABLE = find_spec('numba') is not None
+
+
+# AF 统计用的行动编码：1 激进（bet / raise / all-in），2 被动（call），其余（含盲注、check）不计
+_AF_ACTION_CODES = {
+    ActionType.BET: 1,
+    ActionType.RAISE: 1,
+    ActionType.ALL_IN: 1,
+    ActionType.CALL: 2,
+}
+
+
+def _accumulate_af(player_idx, action_codes, aggressive, passive):
+    """按行动编码累加每位玩家的激进/被动行动次数"""
+    for i in range(len(action_codes)):
+        code = action_codes[i]
+        if code == 1:
+            aggressive[player_idx[i]] += 1
+        elif code == 2:
+            passive[player_idx[i]] += 1
+
+
+@lru_cache(maxsize=None)
+def _af_kernel():
+    """返回 AF 累加函数：numba 可用时为编译后的版本（首次调用时编译，cache=True 时之后读磁盘缓存）"""
+    if NUMBA_AVAILABLE and NUMPY_AVAILABLE:
+        import numba
+        return numba.njit(cache=True, boundscheck=False)(_accumulate_af)
+    return _accumulate_af
+
+
+def _new_position_stats() -> Dict[str, int]:
+    # 模块级函数（而非 lambda），统计结果才能在进程间传递
+    return {
+        'hands': 0,
+        'vpip': 0,
+        'pfr': 0
+    }
+
 
 @dataclass
 class PlayerStatistics:
@@ -51,11 +101,7 @@ class PlayerStatistics:
     saw_river: int = 0
     
     # 位置统计
-    position_stats: Dict[str, Dict] = field(default_factory=lambda: defaultdict(lambda: {
-        'hands': 0,
-        'vpip': 0,
-        'pfr': 0
-    }))
+    position_stats: Dict[str, Dict] = field(default_factory=lambda: defaultdict(_new_position_stats))
     
     # 高级指标
     fold_to_cbet_opportunities: int = 0  # 面对C-Bet的机会
@@ -188,6 +234,115 @@ class PlayerStatistics:
         }
 
 
+# PlayerStatistics 中的整数计数字段
+_COUNT_FIELDS = (
+    'total_hands',
+    'vpip_opportunities', 'vpip_count',
+    'pfr_opportunities', 'pfr_count',
+    'aggressive_actions', 'passive_actions',
+    'three_bet_opportunities', 'three_bet_count',
+    'cbet_opportunities', 'cbet_count',
+    'went_to_showdown', 'won_at_showdown',
+    'saw_flop', 'saw_turn', 'saw_river',
+    'fold_to_cbet_opportunities', 'fold_to_cbet_count',
+    'steal_opportunities', 'steal_attempts',
+    'total_folds', 'preflop_folds', 'postflop_folds',
+    'hands_won',
+)
+
+
+class StatisticsArrays:
+    """
+    按列存放所有玩家的统计计数（每个字段一个 numpy 数组，需要 numpy）
+    
+    下标与 player_keys 一一对应；比率指标对整列一次性计算，
+    结果与 PlayerStatistics 对应属性一致
+    """
+    
+    def __init__(self, stats: Dict[str, PlayerStatistics]):
+        if not NUMPY_AVAILABLE:
+            raise ImportError("StatisticsArrays 需要 numpy: pip install numpy")
+        
+        self.player_keys = list(stats)
+        self.player_names = [s.player_name for s in stats.values()]
+        self.index = {key: i for i, key in enumerate(self.player_keys)}
+        
+        n = len(stats)
+        for name in _COUNT_FIELDS:
+            setattr(self, name, np.fromiter(
+                (getattr(s, name) for s in stats.values()), dtype=np.int64, count=n
+            ))
+        self.total_profit = np.fromiter(
+            (s.total_profit for s in stats.values()), dtype=np.float64, count=n
+        )
+    
+    def __len__(self):
+        return len(self.player_keys)
+    
+    @staticmethod
+    def _pct(counts, opportunities):
+        """counts / opportunities * 100，机会为 0 时记为 0"""
+        return np.divide(counts, opportunities,
+                         out=np.zeros(len(counts)), where=opportunities > 0) * 100
+    
+    @property
+    def vpip(self):
+        return self._pct(self.vpip_count, self.vpip_opportunities)
+    
+    @property
+    def pfr(self):
+        return self._pct(self.pfr_count, self.pfr_opportunities)
+    
+    @property
+    def af(self):
+        """激进因子；没有被动行动时，有激进行动记为 inf，否则为 0"""
+        af = np.where(self.aggressive_actions > 0, np.inf, 0.0)
+        return np.divide(self.aggressive_actions, self.passive_actions,
+                         out=af, where=self.passive_actions > 0)
+    
+    @property
+    def three_bet_pct(self):
+        return self._pct(self.three_bet_count, self.three_bet_opportunities)
+    
+    @property
+    def cbet_pct(self):
+        return self._pct(self.cbet_count, self.cbet_opportunities)
+    
+    @property
+    def wtsd(self):
+        return self._pct(self.went_to_showdown, self.saw_flop)
+    
+    @property
+    def won_sd_pct(self):
+        return self._pct(self.won_at_showdown, self.went_to_showdown)
+    
+    @property
+    def bb_per_100(self):
+        # 与 PlayerStatistics.bb_per_100 相同，假设大盲为2
+        return np.divide(self.total_profit / 2.0, self.total_hands,
+                         out=np.zeros(len(self)), where=self.total_hands > 0) * 100
+    
+    @property
+    def fold_to_cbet_pct(self):
+        return self._pct(self.fold_to_cbet_count, self.fold_to_cbet_opportunities)
+    
+    @property
+    def steal_pct(self):
+        return self._pct(self.steal_attempts, self.steal_opportunities)
+    
+    @property
+    def win_rate(self):
+        return self._pct(self.hands_won, self.total_hands)
+    
+    @property
+    def fold_pct(self):
+        return self._pct(self.total_folds, self.total_hands)
+    
+    @property
+    def preflop_fold_pct(self):
+        return self._pct(self.preflop_folds, self.total_hands)
+
+
 class StatisticsCalculator:
     """统计指标计算器"""
     
@@ -210,6 +365,35 @@ class StatisticsCalculator:
         for hand in self.hands:
             self._analyze_hand(hand)
         
+        self._calculate_af_all()
+        
+        return self.stats
+    
+    def calculate_all_parallel(self, n_jobs: Optional[int] = None) -> Dict[str, PlayerStatistics]:
+        """
+        多进程计算所有指标
+        
+        各玩家的指标互不依赖：按玩家分成 n_jobs 组，每个进程用全部手牌计算一组玩家，
+        最后合并结果。手牌在进程启动时传入一次。
+        
+        Args:
+            n_jobs: 进程数（默认CPU核数）
+        """
+        workers = min(n_jobs or os.cpu_count() or 1, len(self.players))
+        if workers <= 1:
+            # 单核或玩家太少时，进程池只会带来额外开销
+            return self.calculate_all()
+        
+        player_keys = list(self.players)
+        groups = [
+            {key: self.players[key] for key in player_keys[i::workers]}
+            for i in range(workers)
+        ]
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(self.hands,)) as executor:
+            for partial in executor.map(_calculate_in_worker, groups):
+                self.stats.update(partial)
+        
         return self.stats
     
     def _analyze_hand(self, hand: Hand):
@@ -236,9 +420,6 @@ class StatisticsCalculator:
             # 统计PFR
             self._calculate_pfr(stats, player_key, hand, player_actions[player_key])
             
-            # 统计AF
-            self._calculate_af(stats, player_key, hand)
-            
             # 统计3-Bet
             self._calculate_three_bet(stats, player_key, hand, preflop_actions)
             
@@ -292,21 +473,42 @@ class StatisticsCalculator:
                 stats.pfr_count += 1
                 break
     
-    def _calculate_af(self, stats: PlayerStatistics, player_key: str, hand: Hand):
-        """计算激进因子"""
-        all_actions = hand.get_actions_by_player(player_key)
+    def _calculate_af_all(self):
+        """
+        计算所有玩家的激进因子
         
-        for action in all_actions:
-            # 跳过盲注
-            if action.action_type in [ActionType.SMALL_BLIND, ActionType.BIG_BLIND]:
-                continue
-            
-            # 激进行动：bet, raise
-            if action.action_type in [ActionType.BET, ActionType.RAISE, ActionType.ALL_IN]:
-                stats.aggressive_actions += 1
-            # 被动行动：call（不包括check）
-            elif action.action_type == ActionType.CALL:
-                stats.passive_actions += 1
+        一次遍历所有手牌的行动，编码为 (玩家下标, 行动编码) 两列后交给 _af_kernel() 累加
+        （安装了 numba 时为编译后的循环）；只统计在该手牌玩家列表中的玩家
+        """
+        player_keys = list(self.stats)
+        index = {key: i for i, key in enumerate(player_keys)}
+        
+        player_idx = []
+        action_codes = []
+        for hand in self.hands:
+            for street_actions in hand.actions.values():
+                for action in street_actions:
+                    code = _AF_ACTION_CODES.get(action.action_type)
+                    if code is None:
+                        continue
+                    player_key = action.player_full_id
+                    if player_key in index and player_key in hand.players:
+                        player_idx.append(index[player_key])
+                        action_codes.append(code)
+        
+        if NUMPY_AVAILABLE:
+            aggressive = np.zeros(len(player_keys), dtype=np.int64)
+            passive = np.zeros(len(player_keys), dtype=np.int64)
+            _af_kernel()(np.array(player_idx, dtype=np.int32), np.array(action_codes, dtype=np.int8),
+                         aggressive, passive)
+        else:
+            aggressive = [0] * len(player_keys)
+            passive = [0] * len(player_keys)
+            _accumulate_af(player_idx, action_codes, aggressive, passive)
+        
+        for i, player_key in enumerate(player_keys):
+            self.stats[player_key].aggressive_actions += int(aggressive[i])
+            self.stats[player_key].passive_actions += int(passive[i])
     
     def _calculate_three_bet(self, stats: PlayerStatistics, player_key: str,
                             hand: Hand, preflop_actions: List[Action]):
@@ -415,6 +617,10 @@ class StatisticsCalculator:
         """获取指定玩家的统计数据"""
         return self.stats.get(player_key)
     
+    def get_statistics_arrays(self) -> StatisticsArrays:
+        """以列式数组返回所有玩家的统计（需要 numpy）"""
+        return StatisticsArrays(self.stats)
+    
     def get_all_statistics(self) -> Dict[str, PlayerStatistics]:
         """获取所有玩家的统计数据"""
         return self.stats
@@ -558,3 +764,16 @@ class StatisticsCalculator:
         
         print("=" * 120)
 
+
+# 工作进程中的手牌（由 _init_worker 在进程启动时设置）
+_worker_hands: List[Hand] = []
+
+
+def _init_worker(hands: List[Hand]):
+    global _worker_hands
+    _worker_hands = hands
+
+
+def _calculate_in_worker(players: Dict[str, Player]) -> Dict[str, PlayerStatistics]:
+    """工作进程入口：计算一组玩家的指标"""
+    return StatisticsCalculator(_worker_hands, players).calculate_all()
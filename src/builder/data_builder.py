@@ -4,13 +4,13 @@
 """
 
 import re
-from typing import List, Dict
+from typing import Dict, Iterable, List
 from collections import defaultdict
 
 from ..models.hand import Hand
 from ..models.action import Action, ActionType, Street
 from ..models.player import Player
-from ..parser.log_parser import EventType
+from ..parser.log_parser import EventType, LogEvent
 from ..parser.ledger_parser import LedgerParser
 
 
@@ -49,13 +49,13 @@ class DataBuilder:
         # 如果去除后为空（纯数字名称），返回原名称
         return normalized if normalized else name
     
-    def build_from_events(self, events: List[Dict], ledger_file: str = 'log/ledger.csv', 
+    def build_from_events(self, events: Iterable[LogEvent], ledger_file: str = 'log/ledger.csv', 
                          merge_similar_players: bool = False) -> tuple[List[Hand], Dict[str, Player]]:
         """
         从事件列表构建数据模型
         
         Args:
-            events: 解析后的事件列表
+            events: 解析后的事件（列表或 iter_events 等迭代器，只遍历一次）
             ledger_file: ledger文件路径（可选）
             merge_similar_players: 是否合并相似名称的玩家（例如"黄笃读"和"黄笃读2"）
             
@@ -78,9 +78,9 @@ class DataBuilder:
         
         return self.hands, self.players
     
-    def _process_event(self, event: Dict):
+    def _process_event(self, event: LogEvent):
         """处理单个事件"""
-        event_type = event['event_type']
+        event_type = event.event_type
         
         if event_type == EventType.HAND_START:
             self._handle_hand_start(event)
@@ -136,37 +136,37 @@ class DataBuilder:
         if self.current_hand:
             self.current_hand.raw_events.append(event)
     
-    def _handle_hand_start(self, event: Dict):
+    def _handle_hand_start(self, event: LogEvent):
         """处理手牌开始"""
         # 如果有未完成的手牌，先完成它
         if self.current_hand:
             self._finalize_hand()
         
         # 创建新手牌
-        hand_id = event.get('hand_id', 'unknown')
+        hand_id = event.payload.get('hand_id', 'unknown')
         hand_number = int(hand_id) if hand_id.isdigit() else len(self.hands) + 1
         
         self.current_hand = Hand(
             hand_id=hand_id,
             hand_number=hand_number,
-            timestamp=event['timestamp'],
-            dealer=event.get('dealer')
+            timestamp=event.timestamp,
+            dealer=event.payload.get('dealer')
         )
         
         self.current_street = Street.PREFLOP
     
-    def _handle_hand_end(self, event: Dict):
+    def _handle_hand_end(self, event: LogEvent):
         """处理手牌结束"""
         # 手牌结束时完成当前手牌
         if self.current_hand:
             self._finalize_hand()
     
-    def _handle_player_stacks(self, event: Dict):
+    def _handle_player_stacks(self, event: LogEvent):
         """处理玩家筹码信息"""
         if not self.current_hand:
             return
         
-        stacks = event.get('stacks', {})
+        stacks = event.payload.get('stacks', {})
         for player_key, player_info in stacks.items():
             name = player_info['name']
             player_id = player_info['id']
@@ -205,16 +205,16 @@ class DataBuilder:
                 # 清空该玩家的待处理事件
                 self.pending_chip_events[player_key] = []
     
-    def _handle_small_blind(self, event: Dict):
+    def _handle_small_blind(self, event: LogEvent):
         """处理小盲注"""
         if not self.current_hand:
             return
         
-        amount = event.get('amount', 0)
+        amount = event.payload.get('amount', 0)
         self.current_hand.small_blind = amount
         
         # 创建小盲行动
-        player = event.get('player')
+        player = event.payload.get('player')
         if player:
             action = Action(
                 action_type=ActionType.SMALL_BLIND,
@@ -222,20 +222,20 @@ class DataBuilder:
                 player_id=player['id'],
                 amount=amount,
                 street=Street.PREFLOP,
-                timestamp=event['timestamp']
+                timestamp=event.timestamp
             )
             self.current_hand.add_action(action)
     
-    def _handle_big_blind(self, event: Dict):
+    def _handle_big_blind(self, event: LogEvent):
         """处理大盲注"""
         if not self.current_hand:
             return
         
-        amount = event.get('amount', 0)
+        amount = event.payload.get('amount', 0)
         self.current_hand.big_blind = amount
         
         # 创建大盲行动
-        player = event.get('player')
+        player = event.payload.get('player')
         if player:
             action = Action(
                 action_type=ActionType.BIG_BLIND,
@@ -243,50 +243,50 @@ class DataBuilder:
                 player_id=player['id'],
                 amount=amount,
                 street=Street.PREFLOP,
-                timestamp=event['timestamp']
+                timestamp=event.timestamp
             )
             self.current_hand.add_action(action)
     
-    def _handle_flop(self, event: Dict):
+    def _handle_flop(self, event: LogEvent):
         """处理翻牌"""
         if not self.current_hand:
             return
         
-        cards = event.get('cards', [])
+        cards = event.payload.get('cards', [])
         # Flop应该有3张牌，但我们提取所有的
         self.current_hand.flop = cards[:3] if len(cards) >= 3 else cards
         self.current_street = Street.FLOP
     
-    def _handle_turn(self, event: Dict):
+    def _handle_turn(self, event: LogEvent):
         """处理转牌"""
         if not self.current_hand:
             return
         
-        cards = event.get('cards', [])
+        cards = event.payload.get('cards', [])
         # Turn格式: "Turn: 10♥, J♣, J♠ [J♦]"
         # 最后一张是turn牌
         if cards:
             self.current_hand.turn = cards[-1]
         self.current_street = Street.TURN
     
-    def _handle_river(self, event: Dict):
+    def _handle_river(self, event: LogEvent):
         """处理河牌"""
         if not self.current_hand:
             return
         
-        cards = event.get('cards', [])
+        cards = event.payload.get('cards', [])
         # River格式: "River: 10♥, J♣, J♠, J♦ [5♠]"
         # 最后一张是river牌
         if cards:
             self.current_hand.river = cards[-1]
         self.current_street = Street.RIVER
     
-    def _handle_action(self, event: Dict):
+    def _handle_action(self, event: LogEvent):
         """处理玩家行动"""
         if not self.current_hand:
             return
         
-        player = event.get('player')
+        player = event.payload.get('player')
         if not player:
             return
         
@@ -300,7 +300,7 @@ class DataBuilder:
             EventType.ALL_IN: ActionType.ALL_IN,
         }
         
-        action_type = event_to_action.get(event['event_type'])
+        action_type = event_to_action.get(event.event_type)
         if not action_type:
             return
         
@@ -308,20 +308,20 @@ class DataBuilder:
             action_type=action_type,
             player_name=player['name'],
             player_id=player['id'],
-            amount=event.get('amount', 0),
+            amount=event.payload.get('amount', 0),
             street=self.current_street,
-            timestamp=event['timestamp']
+            timestamp=event.timestamp
         )
         
         self.current_hand.add_action(action)
     
-    def _handle_showdown(self, event: Dict):
+    def _handle_showdown(self, event: LogEvent):
         """处理摊牌"""
         if not self.current_hand:
             return
         
-        player = event.get('player')
-        cards = event.get('cards', [])
+        player = event.payload.get('player')
+        cards = event.payload.get('cards', [])
         
         if player and cards:
             self.current_hand.add_showdown(
@@ -330,13 +330,13 @@ class DataBuilder:
                 cards
             )
     
-    def _handle_collected(self, event: Dict):
+    def _handle_collected(self, event: LogEvent):
         """处理收集底池"""
         if not self.current_hand:
             return
         
-        player = event.get('player')
-        amount = event.get('amount', 0)
+        player = event.payload.get('player')
+        amount = event.payload.get('amount', 0)
         
         if player:
             self.current_hand.set_winner(
@@ -345,7 +345,7 @@ class DataBuilder:
                 amount
             )
     
-    def _handle_player_approved(self, event: Dict):
+    def _handle_player_approved(self, event: LogEvent):
         """
         处理玩家批准入场（初始买入）
         
@@ -354,7 +354,7 @@ class DataBuilder:
         # 不做记录，等待 join 事件
         pass
     
-    def _handle_player_join(self, event: Dict):
+    def _handle_player_join(self, event: LogEvent):
         """
         处理玩家入场
         
@@ -363,8 +363,8 @@ class DataBuilder:
         2. 重新买入（quit后再join）
         3. sit back（leave后再join，不是新买入）
         """
-        player = event.get('player')
-        amount = event.get('stack', 0)
+        player = event.payload.get('player')
+        amount = event.payload.get('stack', 0)
         
         if player:
             player_key = f"{player['name']} @ {player['id']}"
@@ -390,30 +390,30 @@ class DataBuilder:
                 # 不记录，只是回座
                 pass
     
-    def _handle_player_quit(self, event: Dict):
+    def _handle_player_quit(self, event: LogEvent):
         """处理玩家退出（带走筹码）"""
-        player = event.get('player')
-        amount = event.get('stack', 0)
+        player = event.payload.get('player')
+        amount = event.payload.get('stack', 0)
         
         if player:
             player_key = f"{player['name']} @ {player['id']}"
             self.player_last_leave_type[player_key] = 'quit'
             # 不记录到 pending_chip_events
     
-    def _handle_player_leave(self, event: Dict):
+    def _handle_player_leave(self, event: LogEvent):
         """处理玩家暂离（stand up）"""
-        player = event.get('player')
-        amount = event.get('stack', 0)
+        player = event.payload.get('player')
+        amount = event.payload.get('stack', 0)
         
         if player:
             player_key = f"{player['name']} @ {player['id']}"
             self.player_last_leave_type[player_key] = 'leave'
             # 不记录到 pending_chip_events
     
-    def _handle_player_adding(self, event: Dict):
+    def _handle_player_adding(self, event: LogEvent):
         """处理补码（adding chips）"""
-        player = event.get('player')
-        amount = event.get('amount', 0)
+        player = event.payload.get('player')
+        amount = event.payload.get('amount', 0)
         
         if player:
             player_key = f"{player['name']} @ {player['id']}"
@@ -4,7 +4,9 @@
 """
 
 import re
-from typing import List, Dict, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import List, Dict, Optional, Tuple
 from pathlib import Path
 from collections import defaultdict
 
@@ -40,7 +42,17 @@ class MultiDayMerger:
         # 提取路径中的最后一个目录名
         dir_name = Path(data_dir).name
         
-        # 尝试匹配不同格式的日期
+        # 常见情况：目录名以日期开头，直接按字符判断，无需正则
+        # 格式1: YYYYMMDD (8位数字)
+        head = dir_name[:8]
+        if len(head) == 8 and head.isdecimal():
+            return head
+        # 格式2: MMDD (4位数字，假设是2025年)，其后不再出现数字
+        head = dir_name[:4]
+        if len(head) == 4 and head.isdecimal() and not any(c.isdecimal() for c in dir_name[4:]):
+            return f"2025{head}"
+        
+        # 日期不在开头时，回退到正则搜索
         # 格式1: YYYYMMDD (8位数字)
         match = re.search(r'(\d{8})', dir_name)
         if match:
@@ -56,9 +68,10 @@ class MultiDayMerger:
         return dir_name
     
     @staticmethod
+    @lru_cache(maxsize=4096)
     def normalize_player_name(name: str) -> str:
         """
-        标准化玩家名称，去除数字后缀
+        标准化玩家名称，去除数字后缀（纯函数，结果按原始名称缓存）
         例如："黄笃读" -> "黄笃读", "黄笃读2" -> "黄笃读", "player123" -> "player"
         """
         normalized = re.sub(r'\d+$', '', name)
@@ -81,29 +94,33 @@ class MultiDayMerger:
             print("多日数据合并")
             print("=" * 80)
         
-        for data_dir in data_dirs:
-            date = self.extract_date_from_path(data_dir)
-            
-            if verbose:
-                print(f"\n加载 {data_dir} (日期: {date})...")
+        # 并发读取各日数据（I/O 与 JSON 解析重叠），合并仍在主线程按日期顺序进行
+        with ThreadPoolExecutor(max_workers=max(1, min(8, len(data_dirs)))) as executor:
+            futures = [executor.submit(JSONStorage.load_data, data_dir) for data_dir in data_dirs]
             
-            try:
-                # 加载该日的数据
-                hands, players = JSONStorage.load_data(data_dir)
+            for data_dir, future in zip(data_dirs, futures):
+                date = self.extract_date_from_path(data_dir)
                 
                 if verbose:
-                    print(f"  ✓ 加载了 {len(hands)} 手牌, {len(players)} 位玩家")
+                    print(f"\n加载 {data_dir} (日期: {date})...")
                 
-                # 合并手牌（添加日期前缀）
-                self._merge_hands(hands, date)
-                
-                # 合并玩家数据
-                self._merge_players(players, date)
-                
-            except Exception as e:
-                if verbose:
-                    print(f"  ⚠️  加载失败: {e}")
-                continue
+                try:
+                    # 加载该日的数据
+                    hands, players = future.result()
+                    
+                    if verbose:
+                        print(f"  ✓ 加载了 {len(hands)} 手牌, {len(players)} 位玩家")
+                    
+                    # 合并手牌（添加日期前缀）
+                    id_map = self._merge_hands(hands, date)
+                    
+                    # 合并玩家数据（复用手牌的新ID映射）
+                    self._merge_players(players, date, id_map)
+                    
+                except Exception as e:
+                    if verbose:
+                        print(f"  ⚠️  加载失败: {e}")
+                    continue
         
         # 合并相似名称的玩家
         if merge_players:
@@ -119,32 +136,43 @@ class MultiDayMerger:
         
         return self.merged_hands, self.merged_players
     
-    def _merge_hands(self, hands: List[Hand], date: str):
+    def _merge_hands(self, hands: List[Hand], date: str) -> Dict[str, str]:
         """
         合并手牌数据，为 hand_id 添加日期前缀
         
         Args:
             hands: 单日手牌列表
             date: 日期字符串
+            
+        Returns:
+            {原始 hand_id: 带日期前缀的 hand_id}
         """
+        id_map = {}
         for hand in hands:
             # 为 hand_id 添加日期前缀
             original_id = hand.hand_id
             hand.hand_id = f"{date}_{original_id}"
+            id_map[original_id] = hand.hand_id
             
             # 更新 players 中的 hand_id 引用（如果需要）
             # 注意：players dict 的 key 不需要改变
             
             self.merged_hands.append(hand)
+        
+        return id_map
     
-    def _merge_players(self, players: Dict[str, Player], date: str):
+    def _merge_players(self, players: Dict[str, Player], date: str, id_map: Optional[Dict[str, str]] = None):
         """
         合并玩家数据
         
         Args:
             players: 单日玩家字典
             date: 日期字符串
+            id_map: _merge_hands 返回的 hand_id 映射，避免为每位玩家重复拼接前缀
         """
+        prefix = date + '_'
+        new_id = (id_map if id_map is not None else {}).get
+        
         for player_key, player in players.items():
             if player_key not in self.merged_players:
                 # 第一次遇到该玩家，创建新的 Player
@@ -167,20 +195,15 @@ class MultiDayMerger:
             merged_player.hands_played += player.hands_played
             
             # 更新 hand_ids（添加日期前缀）
-            for hand_id in player.hand_ids:
-                merged_player.hand_ids.append(f"{date}_{hand_id}")
-            
-            # 合并 starting_stacks（添加日期前缀）
-            for hand_id, stack in player.starting_stacks.items():
-                merged_player.starting_stacks[f"{date}_{hand_id}"] = stack
+            merged_player.hand_ids.extend([new_id(h) or prefix + h for h in player.hand_ids])
             
-            # 合并 hand_profits（添加日期前缀）
-            for hand_id, profit in player.hand_profits.items():
-                merged_player.hand_profits[f"{date}_{hand_id}"] = profit
-            
-            # 合并 hand_buyins（添加日期前缀）
-            for hand_id, buyin in player.hand_buyins.items():
-                merged_player.hand_buyins[f"{date}_{hand_id}"] = buyin
+            # 合并 starting_stacks / hand_profits / hand_buyins（添加日期前缀）
+            merged_player.starting_stacks.update(
+                {new_id(h) or prefix + h: stack for h, stack in player.starting_stacks.items()})
+            merged_player.hand_profits.update(
+                {new_id(h) or prefix + h: profit for h, profit in player.hand_profits.items()})
+            merged_player.hand_buyins.update(
+                {new_id(h) or prefix + h: buyin for h, buyin in player.hand_buyins.items()})
     
     def _merge_similar_players(self, verbose: bool = True):
         """
@@ -190,6 +213,14 @@ class MultiDayMerger:
             print("\n玩家名称合并:")
             print("-" * 80)
         
+        # 少于两位玩家时不可能出现需要合并的组，跳过分组
+        # 注意：单日数据中也会出现同名变体（如"黄笃读"和"黄笃读2"），不能按天数短路
+        if len(self.merged_players) < 2:
+            if verbose:
+                print("未发现需要合并的玩家")
+                print("-" * 80)
+            return
+        
         # 按标准化名称分组
         name_groups = defaultdict(list)
         for player_key, player in self.merged_players.items():
@@ -253,20 +284,20 @@ class MultiDayMerger:
             
             # 更新所有手牌中的玩家引用
             for hand in self.merged_hands:
-                # 更新 hand.players
-                if player_key in hand.players:
-                    hand.players[new_main_key] = hand.players.pop(player_key)
+                # 更新 hand.players（pop 带默认值，每个字典只探测一次）
+                info = hand.players.pop(player_key, None)
+                if info is not None:
+                    hand.players[new_main_key] = info
                 
                 # 更新 hand.winners
-                if player_key in hand.winners:
-                    if new_main_key in hand.winners:
-                        hand.winners[new_main_key] += hand.winners.pop(player_key)
-                    else:
-                        hand.winners[new_main_key] = hand.winners.pop(player_key)
+                amount = hand.winners.pop(player_key, None)
+                if amount is not None:
+                    hand.winners[new_main_key] = hand.winners.get(new_main_key, 0.0) + amount
                 
                 # 更新 showdowns
-                if player_key in hand.showdowns:
-                    hand.showdowns[new_main_key] = hand.showdowns.pop(player_key)
+                cards = hand.showdowns.pop(player_key, None)
+                if cards is not None:
+                    hand.showdowns[new_main_key] = cards
                 
                 # 更新所有 actions（基于player_id匹配，因为玩家名字可能不同）
                 from ..models.action import Street
@@ -284,12 +315,15 @@ class MultiDayMerger:
         if main_key != new_main_key:
             # 更新所有手牌中主玩家的引用
             for hand in self.merged_hands:
-                if main_key in hand.players:
-                    hand.players[new_main_key] = hand.players.pop(main_key)
-                if main_key in hand.winners:
-                    hand.winners[new_main_key] = hand.winners.pop(main_key)
-                if main_key in hand.showdowns:
-                    hand.showdowns[new_main_key] = hand.showdowns.pop(main_key)
+                info = hand.players.pop(main_key, None)
+                if info is not None:
+                    hand.players[new_main_key] = info
+                amount = hand.winners.pop(main_key, None)
+                if amount is not None:
+                    hand.winners[new_main_key] = amount
+                cards = hand.showdowns.pop(main_key, None)
+                if cards is not None:
+                    hand.showdowns[new_main_key] = cards
             
             # 更新玩家字典的key
             self.merged_players[new_main_key] = self.merged_players.pop(main_key)
@@ -1,2 +1,7 @@
 # Data models
 
+import sys
+
+# 批量创建的数据类使用 __slots__，去掉每个实例的 __dict__
+# dataclass(slots=True) 需要 Python 3.10+，旧版本退化为普通 dataclass
+DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
@@ -5,6 +5,7 @@
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
+from . import DATACLASS_SLOTS
 
 
 class Street(Enum):
@@ -27,7 +28,7 @@ class ActionType(Enum):
     BIG_BLIND = "big_blind"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Action:
     """玩家行动模型"""
     action_type: ActionType
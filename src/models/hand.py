@@ -5,10 +5,11 @@
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Dict, List, Optional
+from . import DATACLASS_SLOTS
 from .action import Action, Street
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Hand:
     """手牌模型"""
     hand_id: str
@@ -43,8 +44,8 @@ class Hand:
     pot_size: float = 0.0
     winners: Dict[str, float] = field(default_factory=dict)  # 玩家 -> 赢得金额
     
-    # 原始事件（用于调试）
-    raw_events: List[Dict] = field(default_factory=list)
+    # 原始事件 LogEvent（用于调试）
+    raw_events: list = field(default_factory=list)
     
     def __repr__(self):
         return f"<Hand #{self.hand_number} ({self.hand_id}): {len(self.players)} players, pot: {self.pot_size}>"
@@ -52,12 +53,12 @@ class Hand:
     @property
     def board(self) -> List[str]:
         """完整牌面"""
-        board = self.flop.copy()
-        if self.turn:
-            board.append(self.turn)
-        if self.river:
-            board.append(self.river)
-        return board
+        # 一次性构造，避免 copy 后多次 append 引起的重复分配
+        if self.turn and self.river:
+            return [*self.flop, self.turn, self.river]
+        if self.turn or self.river:
+            return [*self.flop, self.turn or self.river]
+        return self.flop.copy()
     
     @property
     def went_to_flop(self) -> bool:
@@ -4,9 +4,10 @@
 
 from dataclasses import dataclass, field
 from typing import Dict, List
+from . import DATACLASS_SLOTS
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Player:
     """玩家模型"""
     name: str
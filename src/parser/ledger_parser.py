@@ -7,8 +7,10 @@ import csv
 from typing import Dict, List
 from dataclasses import dataclass
 
+from ..models import DATACLASS_SLOTS
 
-@dataclass
+
+@dataclass(**DATACLASS_SLOTS)
 class LedgerEntry:
     """财务记录条目"""
     player_nickname: str
@@ -4,11 +4,46 @@ Poker Now 日志解析器
 """
 
 import csv
+import hashlib
+import io
+import mmap
+import os
+import pickle
 import re
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from typing import List, Dict, Optional, Tuple
+from functools import lru_cache
+from itertools import repeat
+from typing import Iterable, Iterator, List, Dict, Optional, Tuple
 from enum import Enum
 
+from ..storage import BUFFER_SIZE
+
+
+@lru_cache(maxsize=None)
+def _parser_fingerprint() -> str:
+    """本模块源码的哈希，写入缓存键：解析逻辑或 LogEvent / EventType 改动后旧缓存自动失效"""
+    with open(__file__, 'rb') as f:
+        return hashlib.sha1(f.read()).hexdigest()[:12]
+
+
+# 预编译的正则表达式（避免每次调用时查找正则缓存或重复编译）
+# 手牌编号: #91
+_HAND_ID_RE = re.compile(r'#(\d+)')
+# 手牌ID: (id: pu8envt0lo0k)
+_HAND_UUID_RE = re.compile(r'\(id: ([a-z0-9]+)\)')
+# 卡牌: 数字/字母 + 花色符号，支持 10♥, J♣, Q♦, K♠, A♥ 等
+_CARD_RE = re.compile(r'(?:10|[2-9JQKA])[♠♥♦♣♤♡♢♧]')
+# 玩家筹码: #位置号 "玩家名 @ ID" (筹码数)
+_STACKS_RE = re.compile(r'#(\d+) "([^@]+) @ ([^"]+)" \((\d+(?:\.\d+)?)\)')
+
+
+@lru_cache(maxsize=4096)
+def _parse_ts(at: str) -> datetime:
+    """解析 at 列的时间戳（同一手牌里常有多行共用同一时间戳，按字符串缓存）"""
+    return datetime.fromisoformat(at.replace('Z', '+00:00'))
+
 
 class EventType(Enum):
     """事件类型枚举"""
@@ -35,15 +70,28 @@ class EventType(Enum):
     PLAYER_APPROVED = "player_approved"
     PLAYER_ADDING = "player_adding"
     UNKNOWN = "unknown"
+    
+    @property
+    def code(self) -> int:
+        """稳定的整数编号（按定义顺序），便于用数组计数"""
+        return _EVENT_TYPE_CODES[self]
+
+
+_EVENT_TYPE_CODES = {event_type: code for code, event_type in enumerate(EventType)}
 
 
 class LogEvent:
-    """日志事件基类"""
-    def __init__(self, entry: str, timestamp: datetime, order: int, event_type: EventType):
+    """日志事件（__slots__ 类，比每条事件一个 dict 更省内存）"""
+    __slots__ = ('entry', 'timestamp', 'order', 'event_type', 'payload')
+    
+    def __init__(self, entry: str, timestamp: datetime, order: int, event_type: EventType,
+                 payload: Optional[Dict] = None):
         self.entry = entry
         self.timestamp = timestamp
         self.order = order
         self.event_type = event_type
+        # 事件类型相关的解析结果，如 player / amount / cards / stacks
+        self.payload = payload if payload is not None else {}
     
     def __repr__(self):
         return f"<{self.event_type.value} at {self.timestamp}>"
@@ -52,13 +100,23 @@ class LogEvent:
 class PokerNowLogParser:
     """Poker Now 日志解析器"""
     
-    def __init__(self):
+    def __init__(self, keep_unknown: bool = False, cache_dir: Optional[str] = None):
+        """
+        Args:
+            keep_unknown: 是否保留无法识别的条目（UNKNOWN 事件），默认丢弃
+            cache_dir: 解析结果缓存目录；设置后 parse_file 按文件内容哈希缓存事件列表，
+                同一文件再次解析时直接读取缓存
+        """
+        self.keep_unknown = keep_unknown
+        self.cache_dir = cache_dir
         # 玩家名称和ID的正则表达式
         self.player_pattern = re.compile(r'"([^"]+) @ ([^"]+)"')
         # 数字金额的正则表达式
         self.amount_pattern = re.compile(r'\d+(?:\.\d+)?')
+        # (玩家名, 玩家ID) -> 玩家信息字典，同一玩家的事件共用一个字典（只读，不要修改）
+        self._player_cache: Dict[Tuple[str, str], Dict[str, str]] = {}
         
-    def parse_file(self, filepath: str) -> List[Dict]:
+    def parse_file(self, filepath: str) -> List[LogEvent]:
         """
         解析CSV日志文件
         
@@ -68,40 +126,165 @@ class PokerNowLogParser:
         Returns:
             解析后的事件列表（按时间正序排列）
         """
-        events = []
+        if self.cache_dir is None:
+            return list(self._iter_file_events(filepath))
+        
+        cache_path = self._cache_path(filepath)
+        events = _load_cache(cache_path)
+        if events is None:
+            events = list(self._iter_file_events(filepath))
+            _save_cache(cache_path, events)
+        return events
+    
+    def _cache_path(self, filepath: str) -> str:
+        """缓存文件路径：文件内容的 SHA-1、解析器源码指纹，加上影响解析结果的参数"""
+        digest = hashlib.sha1()
+        with open(filepath, 'rb', buffering=BUFFER_SIZE) as f:
+            for block in iter(lambda: f.read(BUFFER_SIZE), b''):
+                digest.update(block)
+        suffix = '-unknown' if self.keep_unknown else ''
+        return os.path.join(self.cache_dir, f"{digest.hexdigest()}-{_parser_fingerprint()}{suffix}.pkl")
+    
+    def iter_events(self, filepath: str) -> Iterator[LogEvent]:
+        """
+        逐条产出CSV日志文件中的事件（按时间正序）
         
-        with open(filepath, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                event = self._parse_row(row)
-                if event:
-                    events.append(event)
+        事件解析出来就交给调用方，不汇总成列表；设置了 cache_dir 时从 parse_file 的缓存读取
         
-        # Poker Now的日志是倒序的，需要反转
-        events.reverse()
+        Args:
+            filepath: CSV文件路径
+            
+        Returns:
+            事件迭代器
+        """
+        if self.cache_dir is not None:
+            yield from self.parse_file(filepath)
+        else:
+            yield from self._iter_file_events(filepath)
+    
+    def _iter_file_events(self, filepath: str) -> Iterator[LogEvent]:
+        """解析CSV日志文件（不使用缓存）"""
+        # newline='' 是 csv 模块推荐的打开方式
+        with open(filepath, 'r', encoding='utf-8', buffering=BUFFER_SIZE, newline='') as f:
+            reader = csv.reader(f)
+            header = next(reader, [])
+            # Poker Now的日志是倒序的，需要先读入全部原始行，再倒着遍历得到正序事件
+            fields = list(_iter_row_fields(reader, header))
+        
+        yield from self._iter_events_reversed(fields)
+    
+    def _iter_events_reversed(self, fields: List[Tuple[str, str, str]]) -> Iterator[LogEvent]:
+        """倒着解析 (entry, at, order) 行（文件中为倒序），产出正序事件"""
+        for entry, at, order in reversed(fields):
+            event = self._parse_row(entry, at, order)
+            if event:
+                yield event
+    
+    def parse_file_parallel(self, filepath: str, max_workers: Optional[int] = None) -> List[LogEvent]:
+        """
+        多进程解析单个CSV日志文件
+        
+        用 mmap 在换行处把文件切成 max_workers 段，各进程独立解析一段后按原顺序合并。
+        切分点前的引号数为奇数（说明落在带换行的引号字段内）时，退回 parse_file 顺序解析
         
+        Args:
+            filepath: CSV文件路径
+            max_workers: 最大进程数，默认为 CPU 核数
+            
+        Returns:
+            解析后的事件列表（按时间正序排列），与 parse_file 一致
+        """
+        workers = max_workers or os.cpu_count() or 1
+        if workers <= 1:
+            return self.parse_file(filepath)
+        
+        # 与 parse_file 共用缓存：命中时不必切分文件
+        cache_path = None
+        if self.cache_dir is not None:
+            cache_path = self._cache_path(filepath)
+            events = _load_cache(cache_path)
+            if events is not None:
+                return events
+        
+        with open(filepath, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return []
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                header_end = mm.find(b'\n') + 1
+                if header_end == 0:
+                    return []
+                header = next(csv.reader([mm[:header_end].decode('utf-8')]), [])
+                ranges = _split_at_newlines(mm, header_end, workers)
+                on_boundaries = _starts_on_record_boundaries(mm, header_end, ranges)
+        
+        if not on_boundaries:
+            # 有引号内的换行落在切分点（或表头）上，按行切分会截断记录，退回顺序解析
+            return self.parse_file(filepath)
+        if 'entry' not in header or 'at' not in header or not ranges:
+            return []
+        
+        with ProcessPoolExecutor(max_workers=min(workers, len(ranges))) as executor:
+            chunks = list(executor.map(
+                _parse_range_in_worker, repeat(filepath), *zip(*ranges),
+                repeat(header), repeat(self.keep_unknown)
+            ))
+        
+        # Poker Now的日志是倒序的：文件中靠后的段时间更早
+        events = []
+        for chunk in reversed(chunks):
+            events.extend(chunk)
+        if cache_path is not None:
+            _save_cache(cache_path, events)
         return events
     
-    def _parse_row(self, row: Dict) -> Optional[Dict]:
+    def parse_files(self, filepaths: Iterable[str], max_workers: Optional[int] = None) -> List[List[LogEvent]]:
+        """
+        并行解析多个CSV日志文件（解析是 CPU 密集型，使用多进程）
+        
+        Args:
+            filepaths: CSV文件路径列表
+            max_workers: 最大进程数，默认为 CPU 核数
+            
+        Returns:
+            每个文件的事件列表，顺序与 filepaths 一致
+        """
+        filepaths = list(filepaths)
+        workers = max_workers or os.cpu_count() or 1
+        if len(filepaths) <= 1 or workers <= 1:
+            # 单个文件或单核时，进程池只会带来额外开销
+            return [self.parse_file(filepath) for filepath in filepaths]
+        
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(_parse_file_in_worker, filepaths, repeat(self.keep_unknown),
+                                     repeat(self.cache_dir), chunksize=1))
+    
+    def _parse_row(self, entry: str, at: str, order: str = '') -> Optional[LogEvent]:
         """
         解析单行数据
         
         Args:
-            row: CSV行数据字典
+            entry: 日志内容（entry 列）
+            at: 时间戳（at 列）
+            order: 排序号（order 列）
             
         Returns:
-            解析后的事件字典
+            解析后的事件
         """
-        entry = row.get('entry', '').strip()
-        at = row.get('at', '').strip()
-        order = row.get('order', '').strip()
+        entry = entry.strip()
+        at = at.strip()
+        order = order.strip()
         
         if not entry or not at:
             return None
         
+        # 识别事件类型（先于时间戳解析，丢弃的条目不必解析时间戳）
+        event_type, parsed_data = self._identify_event_type(entry)
+        if event_type is EventType.UNKNOWN and not self.keep_unknown:
+            return None
+        
         # 解析时间戳
         try:
-            timestamp = datetime.fromisoformat(at.replace('Z', '+00:00'))
+            timestamp = _parse_ts(at)
         except:
             return None
         
@@ -111,21 +294,15 @@ class PokerNowLogParser:
         except:
             order_int = 0
         
-        # 识别事件类型
-        event_type, parsed_data = self._identify_event_type(entry)
-        
-        return {
-            'entry': entry,
-            'timestamp': timestamp,
-            'order': order_int,
-            'event_type': event_type,
-            **parsed_data
-        }
+        return LogEvent(entry, timestamp, order_int, event_type, parsed_data)
     
     def _identify_event_type(self, entry: str) -> Tuple[EventType, Dict]:
         """
         识别事件类型并提取相关数据
         
+        先按条目首字符取出该类条目可能命中的判别词（_DISPATCH_BUCKETS），
+        未命中再按 _DISPATCH_TABLE 的完整优先级查找
+        
         Args:
             entry: 日志条目文本
             
@@ -133,180 +310,83 @@ class PokerNowLogParser:
             (事件类型, 提取的数据字典)
         """
         entry_lower = entry.lower()
+        bucket = _DISPATCH_BUCKETS.get(entry_lower[:1])
+        if bucket is not None:
+            result = self._dispatch(entry, entry_lower, bucket)
+            if result is not None:
+                return result
         
-        # 手牌开始
-        if '-- starting hand #' in entry_lower:
-            hand_id = self._extract_hand_id(entry)
-            dealer = self._extract_player(entry, 'dealer:')
-            return EventType.HAND_START, {
-                'hand_id': hand_id,
-                'dealer': dealer
-            }
-        
-        # 手牌结束
-        if '-- ending hand #' in entry_lower:
-            hand_id = self._extract_hand_id(entry)
-            return EventType.HAND_END, {'hand_id': hand_id}
-        
-        # 玩家筹码
-        if 'player stacks:' in entry_lower:
-            stacks = self._extract_player_stacks(entry)
-            return EventType.PLAYER_STACKS, {'stacks': stacks}
-        
-        # 小盲注
-        if 'posts a small blind of' in entry_lower:
-            player = self._extract_player(entry)
-            amount = self._extract_amount(entry)
-            return EventType.SMALL_BLIND, {
-                'player': player,
-                'amount': amount
-            }
-        
-        # 大盲注
-        if 'posts a big blind of' in entry_lower:
-            player = self._extract_player(entry)
-            amount = self._extract_amount(entry)
-            return EventType.BIG_BLIND, {
-                'player': player,
-                'amount': amount
-            }
-        
-        # 弃牌
-        if '" folds' in entry:
-            player = self._extract_player(entry)
-            return EventType.FOLD, {'player': player}
-        
-        # 过牌
-        if '" checks' in entry:
-            player = self._extract_player(entry)
-            return EventType.CHECK, {'player': player}
-        
-        # 跟注
-        if '" calls' in entry:
-            player = self._extract_player(entry)
-            amount = self._extract_amount(entry)
-            return EventType.CALL, {
-                'player': player,
-                'amount': amount
-            }
-        
-        # 下注
-        if '" bets' in entry:
-            player = self._extract_player(entry)
-            amount = self._extract_amount(entry)
-            return EventType.BET, {
-                'player': player,
-                'amount': amount
-            }
-        
-        # 加注
-        if '" raises to' in entry:
-            player = self._extract_player(entry)
-            amount = self._extract_amount(entry)
-            return EventType.RAISE, {
-                'player': player,
-                'amount': amount
-            }
-        
-        # All-in (可能在bet/raise/call中包含)
-        if 'all-in' in entry_lower or 'all in' in entry_lower:
-            player = self._extract_player(entry)
-            amount = self._extract_amount(entry)
-            return EventType.ALL_IN, {
-                'player': player,
-                'amount': amount
-            }
-        
-        # Flop
-        if 'flop:' in entry_lower:
-            cards = self._extract_cards(entry)
-            return EventType.FLOP, {'cards': cards}
-        
-        # Turn
-        if 'turn:' in entry_lower:
-            cards = self._extract_cards(entry)
-            return EventType.TURN, {'cards': cards}
-        
-        # River
-        if 'river:' in entry_lower:
-            cards = self._extract_cards(entry)
-            return EventType.RIVER, {'cards': cards}
-        
-        # 展示手牌
-        if '" shows' in entry:
-            player = self._extract_player(entry)
-            cards = self._extract_cards(entry)
-            return EventType.SHOW, {
-                'player': player,
-                'cards': cards
-            }
-        
-        # 收集底池
-        if '" collected' in entry and 'from pot' in entry_lower:
-            player = self._extract_player(entry)
-            amount = self._extract_amount(entry)
-            return EventType.COLLECTED, {
-                'player': player,
-                'amount': amount
-            }
-        
-        # 未跟注退回
-        if 'uncalled bet of' in entry_lower:
-            player = self._extract_player(entry, 'returned to')
-            amount = self._extract_amount(entry)
-            return EventType.UNCALLED_BET, {
-                'player': player,
-                'amount': amount
-            }
-        
-        # 玩家加入/离开/买入/补码
-        # 玩家离场（暂离，可能还会回来）
-        if 'stand up with the stack of' in entry_lower:
-            player = self._extract_player(entry)
-            amount = self._extract_amount(entry)
-            return EventType.PLAYER_LEAVE, {
-                'player': player,
-                'stack': amount
-            }
-        
-        # 玩家退出（带走筹码）
-        if 'quits the game with a stack of' in entry_lower:
-            player = self._extract_player(entry)
-            amount = self._extract_amount(entry)
-            return EventType.PLAYER_QUIT, {
-                'player': player,
-                'stack': amount
-            }
-        
-        # 管理员批准入场（初始买入）
-        if 'approved the player' in entry_lower and 'with a stack of' in entry_lower:
-            player = self._extract_player(entry)
-            amount = self._extract_amount(entry)
-            return EventType.PLAYER_APPROVED, {
-                'player': player,
-                'stack': amount
-            }
-        
-        # 玩家加入游戏
-        if 'joined the game with a stack of' in entry_lower:
-            player = self._extract_player(entry)
-            amount = self._extract_amount(entry)
-            return EventType.PLAYER_JOIN, {
-                'player': player,
-                'stack': amount
-            }
-        
-        # 补码（adding chips）
-        if 'adding' in entry_lower and 'chips' in entry_lower:
-            player = self._extract_player(entry)
-            amount = self._extract_amount(entry)
-            return EventType.PLAYER_ADDING, {
-                'player': player,
-                'amount': amount
-            }
+        result = self._dispatch(entry, entry_lower, _DISPATCH_TABLE)
+        if result is not None:
+            return result
         
         return EventType.UNKNOWN, {}
     
+    def _dispatch(self, entry: str, entry_lower: str, table: Tuple) -> Optional[Tuple[EventType, Dict]]:
+        """按表中顺序查找判别词，返回第一个解析成功的结果"""
+        for token, case_sensitive, handler in table:
+            # 玩家行动类判别词在原文上区分大小写，其余在小写文本上匹配
+            if token in (entry if case_sensitive else entry_lower):
+                result = handler(self, entry)
+                if result is not None:
+                    return result
+        return None
+    
+    def _parse_hand_start(self, entry: str) -> Tuple[EventType, Dict]:
+        """手牌开始"""
+        hand_id = self._extract_hand_id(entry)
+        dealer = self._extract_player(entry, 'dealer:')
+        return EventType.HAND_START, {
+            'hand_id': hand_id,
+            'dealer': dealer
+        }
+    
+    def _parse_hand_end(self, entry: str) -> Tuple[EventType, Dict]:
+        """手牌结束"""
+        hand_id = self._extract_hand_id(entry)
+        return EventType.HAND_END, {'hand_id': hand_id}
+    
+    def _parse_player_stacks(self, entry: str) -> Tuple[EventType, Dict]:
+        """玩家筹码"""
+        stacks = self._extract_player_stacks(entry)
+        return EventType.PLAYER_STACKS, {'stacks': stacks}
+    
+    def _parse_show(self, entry: str) -> Tuple[EventType, Dict]:
+        """展示手牌"""
+        player = self._extract_player(entry)
+        cards = self._extract_cards(entry)
+        return EventType.SHOW, {
+            'player': player,
+            'cards': cards
+        }
+    
+    def _parse_collected(self, entry: str) -> Optional[Tuple[EventType, Dict]]:
+        """收集底池"""
+        if 'from pot' not in entry.lower():
+            return None
+        return _on_collected_pot(self, entry)
+    
+    def _parse_uncalled_bet(self, entry: str) -> Tuple[EventType, Dict]:
+        """未跟注退回"""
+        player = self._extract_player(entry, 'returned to')
+        amount = self._extract_amount(entry)
+        return EventType.UNCALLED_BET, {
+            'player': player,
+            'amount': amount
+        }
+    
+    def _parse_player_approved(self, entry: str) -> Optional[Tuple[EventType, Dict]]:
+        """管理员批准入场（初始买入）"""
+        if 'with a stack of' not in entry.lower():
+            return None
+        return _on_player_approved(self, entry)
+    
+    def _parse_player_adding(self, entry: str) -> Optional[Tuple[EventType, Dict]]:
+        """补码（adding chips）"""
+        if 'chips' not in entry.lower():
+            return None
+        return _on_player_adding(self, entry)
+    
     def _extract_player(self, entry: str, keyword: str = None) -> Optional[Dict[str, str]]:
         """
         提取玩家信息
@@ -330,10 +410,12 @@ class PokerNowLogParser:
             match = self.player_pattern.search(entry)
         
         if match:
-            return {
-                'name': match.group(1),
-                'id': match.group(2)
-            }
+            key = match.groups()
+            player = self._player_cache.get(key)
+            if player is None:
+                player = {'name': key[0], 'id': key[1]}
+                self._player_cache[key] = player
+            return player
         return None
     
     def _extract_amount(self, entry: str) -> Optional[float]:
@@ -342,21 +424,25 @@ class PokerNowLogParser:
         
         先移除玩家标识（"玩家名 @ ID"格式），避免匹配到玩家名或ID中的数字
         """
-        # 移除所有玩家标识部分
-        entry_without_players = self.player_pattern.sub('', entry)
-        match = self.amount_pattern.search(entry_without_players)
+        if '@' not in entry:
+            # 没有玩家标识，不必执行替换，直接在原文上查找
+            match = self.amount_pattern.search(entry)
+        else:
+            # 移除所有玩家标识部分
+            entry_without_players = self.player_pattern.sub('', entry)
+            match = self.amount_pattern.search(entry_without_players)
         if match:
             return float(match.group(0))
         return None
     
     def _extract_hand_id(self, entry: str) -> Optional[str]:
         """提取手牌ID"""
-        match = re.search(r'#(\d+)', entry)
+        match = _HAND_ID_RE.search(entry)
         if match:
             return match.group(1)
         
         # 也尝试提取 (id: xxx) 格式
-        match = re.search(r'\(id: ([a-z0-9]+)\)', entry)
+        match = _HAND_UUID_RE.search(entry)
         if match:
             return match.group(1)
         
@@ -369,20 +455,8 @@ class PokerNowLogParser:
         Returns:
             卡牌列表，如 ['A♠', 'K♥', 'Q♦']
         """
-        cards = []
-        
-        # 匹配卡牌格式: 数字/字母 + 花色符号
-        # 支持: 10♥, J♣, Q♦, K♠, A♥ 等
-        card_pattern = re.compile(r'(10|[2-9JQKA])[♠♥♦♣♤♡♢♧]')
-        matches = card_pattern.findall(entry)
-        
-        if matches:
-            # 重新匹配完整的卡牌（包括花色）
-            full_card_pattern = re.compile(r'(10|[2-9JQKA])([♠♥♦♣♤♡♢♧])')
-            for match in full_card_pattern.finditer(entry):
-                cards.append(match.group(0))
-        
-        return cards
+        # 正则不含捕获组，findall 直接返回完整的卡牌（包括花色）
+        return _CARD_RE.findall(entry)
     
     def _extract_player_stacks(self, entry: str) -> Dict[str, float]:
         """
@@ -394,25 +468,190 @@ class PokerNowLogParser:
         stacks = {}
         
         # 匹配格式: #位置号 "玩家名 @ ID" (筹码数)
-        pattern = re.compile(r'#(\d+) "([^@]+) @ ([^"]+)" \((\d+(?:\.\d+)?)\)')
-        
-        for match in pattern.finditer(entry):
-            position = int(match.group(1))
-            name = match.group(2)
-            player_id = match.group(3)
-            stack = float(match.group(4))
-            
-            player_key = f"{name} @ {player_id}"
-            stacks[player_key] = {
-                'position': position,
+        # findall 一次返回所有分组，省去逐个 match.group 调用
+        for position, name, player_id, stack in _STACKS_RE.findall(entry):
+            stacks[f"{name} @ {player_id}"] = {
+                'position': int(position),
                 'name': name,
                 'id': player_id,
-                'stack': stack
+                'stack': float(stack)
             }
         
         return stacks
 
 
+def _iter_row_fields(rows: Iterable[List[str]], header: List[str]) -> Iterator[Tuple[str, str, str]]:
+    """
+    按表头从CSV行中取出 (entry, at, order) 三列
+    
+    表头只解析一次，之后按下标取列；缺少 entry / at 列时不产出任何行，
+    跳过列数不足的行，没有 order 列时 order 为空字符串
+    """
+    if 'entry' not in header or 'at' not in header:
+        return
+    i_entry, i_at = header.index('entry'), header.index('at')
+    i_order = header.index('order') if 'order' in header else None
+    min_len = max(i_entry, i_at) + 1
+    
+    for row in rows:
+        if len(row) < min_len:
+            continue
+        order = row[i_order] if i_order is not None and i_order < len(row) else ''
+        yield row[i_entry], row[i_at], order
+
+
+def _load_cache(cache_path: str) -> Optional[List[LogEvent]]:
+    """读取解析缓存；不存在返回 None，无法读取（损坏、与当前类定义不兼容等）时删除后返回 None"""
+    if not os.path.exists(cache_path):
+        return None
+    try:
+        with open(cache_path, 'rb', buffering=BUFFER_SIZE) as f:
+            return pickle.load(f)
+    except Exception:
+        # 缓存只是加速手段，任何读取失败都退回重新解析
+        try:
+            os.remove(cache_path)
+        except OSError:
+            pass
+        return None
+
+
+def _save_cache(cache_path: str, events: List[LogEvent]):
+    """写入解析缓存（先写临时文件再改名，中断时不会留下不完整的缓存）"""
+    os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb', buffering=BUFFER_SIZE) as f:
+        pickle.dump(events, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, cache_path)
+
+
+def _split_at_newlines(mm: mmap.mmap, start: int, parts: int) -> List[Tuple[int, int]]:
+    """把 [start, 文件末尾) 大致均分成 parts 段，每段的边界都落在行首"""
+    size = len(mm)
+    bounds = [start]
+    for i in range(1, parts):
+        target = max(start + (size - start) * i // parts, bounds[-1])
+        newline = mm.find(b'\n', target)
+        if newline == -1 or newline + 1 >= size:
+            break
+        bounds.append(newline + 1)
+    bounds.append(size)
+    return [(begin, end) for begin, end in zip(bounds, bounds[1:]) if begin < end]
+
+
+def _starts_on_record_boundaries(mm: mmap.mmap, header_end: int, ranges: List[Tuple[int, int]]) -> bool:
+    """
+    检查表头结尾和每段的起点都在记录边界上
+    
+    CSV 中转义的引号成对出现（""），所以某位置之前的引号总数为奇数时，该位置在引号字段内部
+    """
+    quotes = mm[:header_end].count(b'"')
+    if quotes % 2:
+        return False
+    for start, end in ranges[:-1]:
+        quotes += mm[start:end].count(b'"')
+        if quotes % 2:
+            return False
+    return True
+
+
+def _parse_range_in_worker(filepath: str, start: int, end: int,
+                           header: List[str], keep_unknown: bool) -> List[LogEvent]:
+    """工作进程入口：解析文件中 [start, end) 字节范围内的行（该段内倒序解析，得到正序事件）"""
+    with open(filepath, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            text = mm[start:end].decode('utf-8')
+    
+    fields = list(_iter_row_fields(csv.reader(io.StringIO(text, newline='')), header))
+    return list(PokerNowLogParser(keep_unknown)._iter_events_reversed(fields))
+
+
+def _parse_file_in_worker(filepath: str, keep_unknown: bool, cache_dir: Optional[str]) -> List[LogEvent]:
+    """工作进程入口：每个进程各自创建解析器（与主进程的解析器使用同一缓存目录）"""
+    return PokerNowLogParser(keep_unknown, cache_dir).parse_file(filepath)
+
+
+def _player_handler(event_type: EventType, amount_key: Optional[str] = 'amount'):
+    """生成 "玩家 (+ 金额)" 类事件的解析函数（盲注、行动、入场/离场等）"""
+    if amount_key is None:
+        def handler(parser: PokerNowLogParser, entry: str) -> Tuple[EventType, Dict]:
+            return event_type, {'player': parser._extract_player(entry)}
+    else:
+        def handler(parser: PokerNowLogParser, entry: str) -> Tuple[EventType, Dict]:
+            return event_type, {
+                'player': parser._extract_player(entry),
+                amount_key: parser._extract_amount(entry)
+            }
+    return handler
+
+
+def _board_handler(event_type: EventType):
+    """生成 Flop / Turn / River 事件的解析函数"""
+    def handler(parser: PokerNowLogParser, entry: str) -> Tuple[EventType, Dict]:
+        return event_type, {'cards': parser._extract_cards(entry)}
+    return handler
+
+
+_on_collected_pot = _player_handler(EventType.COLLECTED)
+_on_player_approved = _player_handler(EventType.PLAYER_APPROVED, 'stack')
+_on_player_adding = _player_handler(EventType.PLAYER_ADDING)
+
+
+# 事件判别词 -> 解析方法，按原 if 链的优先级排列
+# 同一条目命中多个判别词时，取优先级最高且解析成功的那个
+_HANDLERS = {
+    '-- starting hand #': PokerNowLogParser._parse_hand_start,
+    '-- ending hand #': PokerNowLogParser._parse_hand_end,
+    'player stacks:': PokerNowLogParser._parse_player_stacks,
+    'posts a small blind of': _player_handler(EventType.SMALL_BLIND),
+    'posts a big blind of': _player_handler(EventType.BIG_BLIND),
+    '" folds': _player_handler(EventType.FOLD, amount_key=None),
+    '" checks': _player_handler(EventType.CHECK, amount_key=None),
+    '" calls': _player_handler(EventType.CALL),
+    '" bets': _player_handler(EventType.BET),
+    '" raises to': _player_handler(EventType.RAISE),
+    'all-in': _player_handler(EventType.ALL_IN),
+    'all in': _player_handler(EventType.ALL_IN),
+    'flop:': _board_handler(EventType.FLOP),
+    'turn:': _board_handler(EventType.TURN),
+    'river:': _board_handler(EventType.RIVER),
+    '" shows': PokerNowLogParser._parse_show,
+    '" collected': PokerNowLogParser._parse_collected,
+    'uncalled bet of': PokerNowLogParser._parse_uncalled_bet,
+    # 玩家离场（暂离，可能还会回来）
+    'stand up with the stack of': _player_handler(EventType.PLAYER_LEAVE, amount_key='stack'),
+    # 玩家退出（带走筹码）
+    'quits the game with a stack of': _player_handler(EventType.PLAYER_QUIT, amount_key='stack'),
+    'approved the player': PokerNowLogParser._parse_player_approved,
+    'joined the game with a stack of': _player_handler(EventType.PLAYER_JOIN, amount_key='stack'),
+    'adding': PokerNowLogParser._parse_player_adding,
+}
+# (判别词, 是否区分大小写, 解析方法)
+_DISPATCH_TABLE = tuple(
+    (token, token.startswith('"'), handler) for token, handler in _HANDLERS.items()
+)
+
+# 条目首字符（小写）-> 这类条目可能出现的判别词
+# 如玩家行动都以 "玩家 @ ID" 开头，不必再检查 Flop / 手牌开始等判别词
+_BUCKET_TOKENS = {
+    '"': ('posts a small blind of', 'posts a big blind of', '" folds', '" checks', '" calls',
+          '" bets', '" raises to', 'all-in', 'all in', '" shows', '" collected'),
+    '-': ('-- starting hand #', '-- ending hand #'),
+    'p': ('player stacks:',),
+    'f': ('flop:',),
+    't': ('turn:', 'stand up with the stack of', 'quits the game with a stack of',
+          'approved the player', 'joined the game with a stack of'),
+    'r': ('river:',),
+    'u': ('uncalled bet of',),
+    'w': ('adding',),
+}
+# 首字符 -> _DISPATCH_TABLE 的子集（保持原优先级）
+_DISPATCH_BUCKETS = {
+    first: tuple(row for row in _DISPATCH_TABLE if row[0] in tokens)
+    for first, tokens in _BUCKET_TOKENS.items()
+}
+
+
 def test_parser():
     """测试解析器"""
     parser = PokerNowLogParser()
@@ -463,12 +702,21 @@ def test_parser():
     
     print("测试解析器功能：\n")
     for test_entry in test_entries:
-        result = parser._parse_row(test_entry)
+        result = parser._parse_row(test_entry['entry'], test_entry['at'], test_entry['order'])
         if result:
             print(f"原始: {test_entry['entry'][:60]}...")
-            print(f"类型: {result['event_type'].value}")
-            print(f"数据: {result}")
+            print(f"类型: {result.event_type.value}")
+            print(f"数据: {result.payload}")
             print("-" * 80)
+    
+    # 只有表头的文件：顺序与并行解析都应返回空列表
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        header_only = os.path.join(tmp_dir, 'header_only.csv')
+        with open(header_only, 'w', encoding='utf-8') as f:
+            f.write('entry,at,order\n')
+        assert parser.parse_file(header_only) == []
+        assert parser.parse_file_parallel(header_only, max_workers=2) == []
+    print("只有表头的CSV：顺序/并行解析均返回空列表")
 
 
 if __name__ == '__main__':
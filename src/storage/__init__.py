@@ -1,2 +1,4 @@
 # Storage module
 
+# 读写数据文件时的缓冲区大小（大缓冲减少 read / write 调用），解析器读取日志时同样使用
+BUFFER_SIZE = 1 << 20
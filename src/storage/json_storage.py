@@ -3,14 +3,155 @@ JSON数据持久化
 """
 
 import json
-from datetime import datetime
-from typing import List, Dict
+from collections.abc import Mapping
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Optional, Tuple, Union
 from pathlib import Path
 
+from . import BUFFER_SIZE
 from ..models.hand import Hand
 from ..models.player import Player
 from ..models.action import Action, Street, ActionType
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+
+def _read_json(filepath: Path):
+    """一次性读入整个JSON文件再解析，优先使用 orjson（C 实现，解析更快）"""
+    with open(filepath, 'rb', buffering=BUFFER_SIZE) as f:
+        raw = f.read()
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def _encode_timestamp(dt: datetime) -> Union[int, str]:
+    """
+    时间戳编码为 UTC 微秒整数（比 ISO 字符串更小，编解码更快）
+    
+    不带时区的 datetime 无法换算成 UTC，仍保存为 ISO 字符串
+    """
+    if dt.tzinfo is None:
+        return dt.isoformat()
+    return (dt - _EPOCH) // _MICROSECOND
+
+
+def _decode_timestamp(value: Union[int, str]) -> datetime:
+    """解码时间戳，兼容旧文件中的 ISO 字符串"""
+    if isinstance(value, int):
+        return _EPOCH + timedelta(microseconds=value)
+    return datetime.fromisoformat(value)
+
+
+def _dumps(obj, indent: Optional[int]) -> bytes:
+    """编码为 UTF-8 JSON，优先使用 orjson（orjson 只支持 2 空格缩进）"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, ensure_ascii=False, indent=indent).encode('utf-8')
+
+
+def _write_json_array(filepath: Path, items: Iterable, indent: Optional[int] = None):
+    """逐个元素写出JSON数组，内存中同时只保留一个序列化后的元素"""
+    with open(filepath, 'wb', buffering=BUFFER_SIZE) as f:
+        f.write(b'[')
+        for i, item in enumerate(items):
+            f.write(b',\n' if i else b'\n')
+            f.write(_dumps(item, indent))
+        f.write(b'\n]')
+
+
+def _write_json_object(filepath: Path, pairs: Iterable[Tuple[str, object]], indent: Optional[int] = None):
+    """逐个键值对写出JSON对象"""
+    with open(filepath, 'wb', buffering=BUFFER_SIZE) as f:
+        f.write(b'{')
+        for i, (key, value) in enumerate(pairs):
+            f.write(b',\n' if i else b'\n')
+            f.write(_dumps(key, None))
+            f.write(b': ')
+            f.write(_dumps(value, indent))
+        f.write(b'\n}')
+
+
+def _write_msgpack_array(filepath: Path, items: Iterable, count: int):
+    """逐个元素写出 msgpack 数组（先写数组头，再依次追加元素）"""
+    packer = msgpack.Packer(use_bin_type=True)
+    with open(filepath, 'wb', buffering=BUFFER_SIZE) as f:
+        f.write(packer.pack_array_header(count))
+        for item in items:
+            f.write(packer.pack(item))
+
+
+def _write_msgpack_map(filepath: Path, pairs: Iterable[Tuple[str, object]], count: int):
+    """逐个键值对写出 msgpack 字典"""
+    packer = msgpack.Packer(use_bin_type=True)
+    with open(filepath, 'wb', buffering=BUFFER_SIZE) as f:
+        f.write(packer.pack_map_header(count))
+        for key, value in pairs:
+            f.write(packer.pack(key))
+            f.write(packer.pack(value))
+
+
+def _read_msgpack(filepath: Path):
+    with open(filepath, 'rb', buffering=BUFFER_SIZE) as f:
+        raw = f.read()
+    return msgpack.unpackb(raw, raw=False)
+
+
+# 存储格式 -> 文件扩展名
+_FORMAT_SUFFIXES = {'json': '.json', 'msgpack': '.msgpack'}
+
+
+def _check_format(format: str):
+    if format not in _FORMAT_SUFFIXES:
+        raise ValueError(f"不支持的存储格式: {format}（可选: {', '.join(_FORMAT_SUFFIXES)}）")
+    if format == 'msgpack' and not MSGPACK_AVAILABLE:
+        raise ImportError("msgpack 格式需要安装 msgpack: pip install msgpack")
+
+
+class _LazyActions(Mapping):
+    """
+    按街道延迟反序列化的行动表（Street -> List[Action]）
+    
+    首次访问某条街时才构造该街的 Action 列表，之后返回同一个列表（可以 append）
+    """
+    __slots__ = ('_raw', '_cache')
+    
+    def __init__(self, actions_data: Dict[str, List[Dict]]):
+        self._raw: Dict[Street, List[Dict]] = dict.fromkeys(Street, ())
+        for street_str, street_actions in actions_data.items():
+            self._raw[Street(street_str)] = street_actions
+        self._cache: Dict[Street, List[Action]] = {}
+    
+    def __getitem__(self, street: Street) -> List[Action]:
+        actions = self._cache.get(street)
+        if actions is None:
+            actions = [JSONStorage.deserialize_action(data) for data in self._raw[street]]
+            self._cache[street] = actions
+        return actions
+    
+    def __iter__(self):
+        return iter(self._raw)
+    
+    def __len__(self):
+        return len(self._raw)
+    
+    def __repr__(self):
+        return f"{type(self).__name__}({dict(self)!r})"
+
 
 class JSONStorage:
     """JSON存储"""
@@ -21,7 +162,7 @@ class JSONStorage:
         return {
             'hand_id': hand.hand_id,
             'hand_number': hand.hand_number,
-            'timestamp': hand.timestamp.isoformat(),
+            'timestamp': _encode_timestamp(hand.timestamp),
             'dealer': hand.dealer,
             'players': hand.players,
             'small_blind': hand.small_blind,
@@ -30,17 +171,7 @@ class JSONStorage:
             'turn': hand.turn,
             'river': hand.river,
             'actions': {
-                street.value: [
-                    {
-                        'action_type': action.action_type.value,
-                        'player_name': action.player_name,
-                        'player_id': action.player_id,
-                        'amount': action.amount,
-                        'street': action.street.value,
-                        'timestamp': action.timestamp.isoformat() if action.timestamp else None
-                    }
-                    for action in actions
-                ]
+                street.value: [JSONStorage.serialize_action(action) for action in actions]
                 for street, actions in hand.actions.items()
             },
             'showdowns': hand.showdowns,
@@ -48,14 +179,40 @@ class JSONStorage:
             'winners': hand.winners,
         }
     
+    @staticmethod
+    def serialize_action(action: Action) -> Dict:
+        """序列化行动对象"""
+        return {
+            'action_type': action.action_type.value,
+            'player_name': action.player_name,
+            'player_id': action.player_id,
+            'amount': action.amount,
+            'street': action.street.value,
+            'timestamp': _encode_timestamp(action.timestamp) if action.timestamp else None
+        }
+    
+    @staticmethod
+    def deserialize_action(data: Dict) -> Action:
+        """反序列化行动对象"""
+        return Action(
+            action_type=ActionType(data['action_type']),
+            player_name=data['player_name'],
+            player_id=data['player_id'],
+            amount=data['amount'],
+            street=Street(data['street']),
+            timestamp=_decode_timestamp(data['timestamp']) if data.get('timestamp') is not None else None
+        )
+    
     @staticmethod
     def deserialize_hand(data: Dict) -> Hand:
         """反序列化手牌对象"""
         hand = Hand(
             hand_id=data['hand_id'],
             hand_number=data['hand_number'],
-            timestamp=datetime.fromisoformat(data['timestamp']),
+            timestamp=_decode_timestamp(data['timestamp']),
             dealer=data.get('dealer'),
+            # 行动按街道延迟反序列化，只读取摘要字段时不必构造 Action 对象
+            actions=_LazyActions(data['actions']),
         )
         
         hand.players = data['players']
@@ -68,20 +225,6 @@ class JSONStorage:
         hand.pot_size = data['pot_size']
         hand.winners = data.get('winners', {})
         
-        # 反序列化actions
-        for street_str, actions_data in data['actions'].items():
-            street = Street(street_str)
-            for action_data in actions_data:
-                action = Action(
-                    action_type=ActionType(action_data['action_type']),
-                    player_name=action_data['player_name'],
-                    player_id=action_data['player_id'],
-                    amount=action_data['amount'],
-                    street=Street(action_data['street']),
-                    timestamp=datetime.fromisoformat(action_data['timestamp']) if action_data.get('timestamp') else None
-                )
-                hand.actions[street].append(action)
-        
         return hand
     
     @staticmethod
@@ -123,7 +266,8 @@ class JSONStorage:
         return player
     
     @staticmethod
-    def save_data(hands: List[Hand], players: Dict[str, Player], output_dir: str = 'data'):
+    def save_data(hands: List[Hand], players: Dict[str, Player], output_dir: str = 'data',
+                  indent: Optional[int] = None, format: str = 'json'):
         """
         保存数据到JSON文件
         
@@ -131,24 +275,25 @@ class JSONStorage:
             hands: 手牌列表
             players: 玩家字典
             output_dir: 输出目录
+            indent: 缩进（默认紧凑输出，需要人工阅读时可传入 2）
+            format: 'json'，或 'msgpack'（二进制，文件更小，适合归档；需要安装 msgpack）
         """
+        _check_format(format)
+        suffix = _FORMAT_SUFFIXES[format]
         output_path = Path(output_dir)
         output_path.mkdir(exist_ok=True)
         
-        # 保存手牌数据
-        hands_data = [JSONStorage.serialize_hand(hand) for hand in hands]
-        hands_file = output_path / 'hands.json'
-        with open(hands_file, 'w', encoding='utf-8') as f:
-            json.dump(hands_data, f, ensure_ascii=False, indent=2)
-        
-        # 保存玩家数据
-        players_data = {
-            key: JSONStorage.serialize_player(player)
-            for key, player in players.items()
-        }
-        players_file = output_path / 'players.json'
-        with open(players_file, 'w', encoding='utf-8') as f:
-            json.dump(players_data, f, ensure_ascii=False, indent=2)
+        # 保存手牌和玩家数据（流式写出，不在内存中构造完整列表）
+        hands_file = output_path / f'hands{suffix}'
+        players_file = output_path / f'players{suffix}'
+        hand_items = (JSONStorage.serialize_hand(hand) for hand in hands)
+        player_pairs = ((key, JSONStorage.serialize_player(player)) for key, player in players.items())
+        if format == 'msgpack':
+            _write_msgpack_array(hands_file, hand_items, len(hands))
+            _write_msgpack_map(players_file, player_pairs, len(players))
+        else:
+            _write_json_array(hands_file, hand_items, indent)
+            _write_json_object(players_file, player_pairs, indent)
         
         # 保存摘要信息
         summary = {
@@ -161,8 +306,8 @@ class JSONStorage:
             'generated_at': datetime.now().isoformat(),
         }
         summary_file = output_path / 'summary.json'
-        with open(summary_file, 'w', encoding='utf-8') as f:
-            json.dump(summary, f, ensure_ascii=False, indent=2)
+        with open(summary_file, 'wb') as f:
+            f.write(_dumps(summary, 2))
         
         return {
             'hands_file': str(hands_file),
@@ -171,28 +316,30 @@ class JSONStorage:
         }
     
     @staticmethod
-    def load_data(data_dir: str = 'data') -> tuple[List[Hand], Dict[str, Player]]:
+    def load_data(data_dir: str = 'data', format: str = 'json') -> tuple[List[Hand], Dict[str, Player]]:
         """
         从JSON文件加载数据
         
         Args:
             data_dir: 数据目录
+            format: 'json' 或 'msgpack'，需与保存时一致
             
         Returns:
             (hands, players)
         """
+        _check_format(format)
+        suffix = _FORMAT_SUFFIXES[format]
+        read = _read_msgpack if format == 'msgpack' else _read_json
         data_path = Path(data_dir)
         
         # 加载手牌
-        hands_file = data_path / 'hands.json'
-        with open(hands_file, 'r', encoding='utf-8') as f:
-            hands_data = json.load(f)
+        hands_file = data_path / f'hands{suffix}'
+        hands_data = read(hands_file)
         hands = [JSONStorage.deserialize_hand(data) for data in hands_data]
         
         # 加载玩家
-        players_file = data_path / 'players.json'
-        with open(players_file, 'r', encoding='utf-8') as f:
-            players_data = json.load(f)
+        players_file = data_path / f'players{suffix}'
+        players_data = read(players_file)
         players = {
             key: JSONStorage.deserialize_player(data)
             for key, data in players_data.items()
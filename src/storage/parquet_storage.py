@@ -0,0 +1,150 @@
+"""
+Parquet数据持久化（列式存储，需要安装 pyarrow）
+"""
+
+import json
+from pathlib import Path
+from typing import Dict, List
+
+from ..models.hand import Hand
+from ..models.player import Player
+from .json_storage import JSONStorage
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+
+# 嵌套的字典字段以JSON字符串列存储
+_HAND_JSON_FIELDS = ('dealer', 'players', 'showdowns', 'winners')
+_PLAYER_JSON_FIELDS = ('starting_stacks', 'hand_profits', 'hand_buyins')
+
+
+def _require_pyarrow():
+    if not PYARROW_AVAILABLE:
+        raise ImportError("ParquetStorage 需要 pyarrow: pip install pyarrow")
+
+
+class ParquetStorage:
+    """
+    Parquet存储
+
+    手牌、行动、玩家各存一张表；行动表按列存储，
+    action_type / player_id 等重复值多的列由 Parquet 字典编码。
+    JSONStorage 仍保留，便于人工查看数据。
+    """
+
+    COMPRESSION = 'zstd'
+
+    @staticmethod
+    def save_data(hands: List[Hand], players: Dict[str, Player], output_dir: str = 'data'):
+        """
+        保存数据到Parquet文件
+
+        Args:
+            hands: 手牌列表
+            players: 玩家字典
+            output_dir: 输出目录
+        """
+        _require_pyarrow()
+        output_path = Path(output_dir)
+        output_path.mkdir(exist_ok=True)
+
+        # 手牌表和行动表（行动通过 hand_index 关联到手牌表的行号）
+        hand_columns = {name: [] for name in (
+            'hand_id', 'hand_number', 'timestamp', 'small_blind', 'big_blind',
+            'flop', 'turn', 'river', 'pot_size', *_HAND_JSON_FIELDS
+        )}
+        action_columns = {name: [] for name in (
+            'hand_index', 'action_type', 'player_name', 'player_id', 'amount', 'street', 'timestamp'
+        )}
+        for hand_index, hand in enumerate(hands):
+            data = JSONStorage.serialize_hand(hand)
+            for name in ('hand_id', 'hand_number', 'small_blind', 'big_blind',
+                         'flop', 'turn', 'river', 'pot_size'):
+                hand_columns[name].append(data[name])
+            hand_columns['timestamp'].append(hand.timestamp.isoformat())
+            for name in _HAND_JSON_FIELDS:
+                hand_columns[name].append(json.dumps(data[name], ensure_ascii=False))
+
+            for street_actions in hand.actions.values():
+                for action in street_actions:
+                    action_columns['hand_index'].append(hand_index)
+                    action_columns['action_type'].append(action.action_type.value)
+                    action_columns['player_name'].append(action.player_name)
+                    action_columns['player_id'].append(action.player_id)
+                    action_columns['amount'].append(action.amount)
+                    action_columns['street'].append(action.street.value)
+                    action_columns['timestamp'].append(
+                        action.timestamp.isoformat() if action.timestamp else None
+                    )
+
+        # 玩家表
+        player_columns = {name: [] for name in (
+            'key', 'name', 'player_id', 'hands_played', 'total_profit', 'total_buy_in',
+            'total_buy_out', 'final_stack', 'sessions', 'hand_ids', *_PLAYER_JSON_FIELDS
+        )}
+        for key, player in players.items():
+            data = JSONStorage.serialize_player(player)
+            player_columns['key'].append(key)
+            for name in ('name', 'player_id', 'hands_played', 'total_profit', 'total_buy_in',
+                         'total_buy_out', 'final_stack', 'sessions', 'hand_ids'):
+                player_columns[name].append(data[name])
+            for name in _PLAYER_JSON_FIELDS:
+                player_columns[name].append(json.dumps(data[name], ensure_ascii=False))
+
+        files = {
+            'hands_file': (output_path / 'hands.parquet', hand_columns),
+            'actions_file': (output_path / 'actions.parquet', action_columns),
+            'players_file': (output_path / 'players.parquet', player_columns),
+        }
+        for filepath, columns in files.values():
+            pq.write_table(pa.Table.from_pydict(columns), filepath, compression=ParquetStorage.COMPRESSION)
+
+        return {key: str(filepath) for key, (filepath, _) in files.items()}
+
+    @staticmethod
+    def load_data(data_dir: str = 'data') -> tuple[List[Hand], Dict[str, Player]]:
+        """
+        从Parquet文件加载数据
+
+        Args:
+            data_dir: 数据目录
+
+        Returns:
+            (hands, players)
+        """
+        _require_pyarrow()
+        data_path = Path(data_dir)
+
+        # 按列读取，再还原成 JSONStorage 的字典格式复用其反序列化逻辑
+        hand_columns = pq.read_table(data_path / 'hands.parquet').to_pydict()
+        hands_data = []
+        for i in range(len(hand_columns['hand_id'])):
+            data = {name: values[i] for name, values in hand_columns.items()}
+            for name in _HAND_JSON_FIELDS:
+                data[name] = json.loads(data[name])
+            data['actions'] = {}
+            hands_data.append(data)
+
+        action_columns = pq.read_table(data_path / 'actions.parquet').to_pydict()
+        names = list(action_columns)
+        for row in zip(*action_columns.values()):
+            action = dict(zip(names, row))
+            actions = hands_data[action.pop('hand_index')]['actions']
+            actions.setdefault(action['street'], []).append(action)
+
+        hands = [JSONStorage.deserialize_hand(data) for data in hands_data]
+
+        player_columns = pq.read_table(data_path / 'players.parquet').to_pydict()
+        players = {}
+        for i, key in enumerate(player_columns['key']):
+            data = {name: values[i] for name, values in player_columns.items()}
+            for name in _PLAYER_JSON_FIELDS:
+                data[name] = json.loads(data[name])
+            players[key] = JSONStorage.deserialize_player(data)
+
+        return hands, players
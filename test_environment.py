@@ -6,6 +6,7 @@
 
 import sys
 import os
+import shutil
 
 def test_python_version():
     """测试Python版本"""
@@ -31,38 +32,57 @@ def test_selenium():
         return False
 
 def test_webdriver():
-    """测试WebDriver"""
+    """
+    测试WebDriver
+    
+    默认只检查驱动程序是否在 PATH 中；加 --deep 参数时才实际启动无头浏览器（每个需要数秒）
+    """
     print("\n3. 检查WebDriver...")
     
+    deep = '--deep' in sys.argv
     drivers_found = []
     
     # 测试 geckodriver (Firefox)
-    try:
-        from selenium import webdriver
-        from selenium.webdriver.firefox.options import Options as FirefoxOptions
-        options = FirefoxOptions()
-        options.add_argument('--headless')
-        driver = webdriver.Firefox(options=options)
-        driver.quit()
-        print("   ✓ geckodriver (Firefox) 可用")
-        drivers_found.append('firefox')
-    except Exception as e:
-        print(f"   ✗ geckodriver (Firefox) 不可用: {str(e)[:50]}...")
+    if not shutil.which('geckodriver'):
+        print("   ✗ geckodriver (Firefox) 未找到")
         print("   安装方法: brew install geckodriver")
+    elif not deep:
+        print("   ✓ geckodriver (Firefox) 已找到（加 --deep 启动浏览器验证）")
+        drivers_found.append('firefox')
+    else:
+        try:
+            from selenium import webdriver
+            from selenium.webdriver.firefox.options import Options as FirefoxOptions
+            options = FirefoxOptions()
+            options.add_argument('--headless')
+            driver = webdriver.Firefox(options=options)
+            driver.quit()
+            print("   ✓ geckodriver (Firefox) 可用")
+            drivers_found.append('firefox')
+        except Exception as e:
+            print(f"   ✗ geckodriver (Firefox) 不可用: {str(e)[:50]}...")
+            print("   安装方法: brew install geckodriver")
     
     # 测试 chromedriver (Chrome)
-    try:
-        from selenium import webdriver
-        from selenium.webdriver.chrome.options import Options as ChromeOptions
-        options = ChromeOptions()
-        options.add_argument('--headless')
-        driver = webdriver.Chrome(options=options)
-        driver.quit()
-        print("   ✓ chromedriver (Chrome) 可用")
-        drivers_found.append('chrome')
-    except Exception as e:
-        print(f"   ✗ chromedriver (Chrome) 不可用: {str(e)[:50]}...")
+    if not shutil.which('chromedriver'):
+        print("   ✗ chromedriver (Chrome) 未找到")
         print("   安装方法: brew install chromedriver")
+    elif not deep:
+        print("   ✓ chromedriver (Chrome) 已找到（加 --deep 启动浏览器验证）")
+        drivers_found.append('chrome')
+    else:
+        try:
+            from selenium import webdriver
+            from selenium.webdriver.chrome.options import Options as ChromeOptions
+            options = ChromeOptions()
+            options.add_argument('--headless')
+            driver = webdriver.Chrome(options=options)
+            driver.quit()
+            print("   ✓ chromedriver (Chrome) 可用")
+            drivers_found.append('chrome')
+        except Exception as e:
+            print(f"   ✗ chromedriver (Chrome) 不可用: {str(e)[:50]}...")
+            print("   安装方法: brew install chromedriver")
     
     return len(drivers_found) > 0
 
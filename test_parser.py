@@ -3,7 +3,36 @@
 """
 
 from src.parser.log_parser import PokerNowLogParser, EventType
-from collections import Counter
+
+
+def _print_hand_start(event):
+    print(f"    手牌ID: {event.payload.get('hand_id')}")
+    if event.payload.get('dealer'):
+        print(f"    庄家: {event.payload['dealer']['name']}")
+
+
+def _print_action(event):
+    if event.payload.get('player'):
+        print(f"    玩家: {event.payload['player']['name']}")
+    if event.payload.get('amount'):
+        print(f"    金额: {event.payload['amount']}")
+
+
+def _print_board(event):
+    print(f"    牌面: {event.payload.get('cards', [])}")
+
+
+# 事件类型 -> 示例中额外输出的详情
+_DETAIL_PRINTERS = {
+    EventType.HAND_START: _print_hand_start,
+    EventType.BET: _print_action,
+    EventType.RAISE: _print_action,
+    EventType.CALL: _print_action,
+    EventType.FLOP: _print_board,
+    EventType.TURN: _print_board,
+    EventType.RIVER: _print_board,
+}
+
 
 def main():
     parser = PokerNowLogParser()
@@ -12,68 +41,74 @@ def main():
     log_file = 'poker_now_log_pgleW51Lpe_LURB2EJlJSqety.csv'
     print(f"开始解析文件: {log_file}\n")
     
-    events = parser.parse_file(log_file)
+    # 流式读取事件，一次遍历完成所有统计，不保留完整事件列表
+    event_counts = [0] * len(EventType)  # 按事件编号计数
+    first_events = []
+    hand_start_count = 0
+    hand_end_count = 0
+    first_hand_id = None
+    last_hand_id = None
+    players = set()
     
-    print(f"✓ 成功解析 {len(events)} 条事件\n")
+    for event in parser.iter_events(log_file):
+        event_type = event.event_type
+        event_counts[event_type.code] += 1
+        if len(first_events) < 10:
+            first_events.append(event)
+        
+        if event_type == EventType.HAND_START:
+            hand_start_count += 1
+            last_hand_id = event.payload.get('hand_id')
+            if hand_start_count == 1:
+                first_hand_id = last_hand_id
+        elif event_type == EventType.HAND_END:
+            hand_end_count += 1
+        
+        # 以 (玩家名, 玩家ID) 元组去重，显示用的字符串只在输出时拼接
+        if event.payload.get('player'):
+            player_info = event.payload['player']
+            players.add((player_info['name'], player_info['id']))
+        elif event_type == EventType.PLAYER_STACKS:
+            stacks = event.payload.get('stacks', {})
+            for stack_info in stacks.values():
+                players.add((stack_info['name'], stack_info['id']))
     
-    # 统计事件类型
-    event_counts = Counter(event['event_type'] for event in events)
+    print(f"✓ 成功解析 {sum(event_counts)} 条事件\n")
     
     print("=" * 80)
     print("事件类型统计:")
     print("=" * 80)
-    for event_type, count in sorted(event_counts.items(), key=lambda x: x[1], reverse=True):
-        print(f"{event_type.value:20s}: {count:5d} 条")
+    # 按数量从多到少，数量相同时按事件编号
+    for event_type, count in sorted(zip(EventType, event_counts), key=lambda item: -item[1]):
+        if count:
+            print(f"{event_type.value:20s}: {count:5d} 条")
     
     print("\n" + "=" * 80)
     print("前10条事件示例:")
     print("=" * 80)
-    for i, event in enumerate(events[:10]):
-        print(f"\n[{i+1}] {event['event_type'].value}")
-        print(f"    时间: {event['timestamp']}")
-        print(f"    原文: {event['entry'][:70]}...")
-        if event['event_type'] == EventType.HAND_START:
-            print(f"    手牌ID: {event.get('hand_id')}")
-            if event.get('dealer'):
-                print(f"    庄家: {event['dealer']['name']}")
-        elif event['event_type'] in [EventType.BET, EventType.RAISE, EventType.CALL]:
-            if event.get('player'):
-                print(f"    玩家: {event['player']['name']}")
-            if event.get('amount'):
-                print(f"    金额: {event['amount']}")
-        elif event['event_type'] in [EventType.FLOP, EventType.TURN, EventType.RIVER]:
-            print(f"    牌面: {event.get('cards', [])}")
-    
-    # 统计手牌数量
-    hand_starts = [e for e in events if e['event_type'] == EventType.HAND_START]
-    hand_ends = [e for e in events if e['event_type'] == EventType.HAND_END]
+    for i, event in enumerate(first_events):
+        print(f"\n[{i+1}] {event.event_type.value}")
+        print(f"    时间: {event.timestamp}")
+        print(f"    原文: {event.entry[:70]}...")
+        print_details = _DETAIL_PRINTERS.get(event.event_type)
+        if print_details:
+            print_details(event)
     
     print("\n" + "=" * 80)
     print("手牌统计:")
     print("=" * 80)
-    print(f"手牌开始: {len(hand_starts)} 次")
-    print(f"手牌结束: {len(hand_ends)} 次")
-    
-    if hand_starts:
-        print(f"\n第一手牌ID: {hand_starts[0].get('hand_id')}")
-        print(f"最后一手牌ID: {hand_starts[-1].get('hand_id')}")
+    print(f"手牌开始: {hand_start_count} 次")
+    print(f"手牌结束: {hand_end_count} 次")
     
-    # 统计玩家
-    players = set()
-    for event in events:
-        if event.get('player'):
-            player_info = event['player']
-            players.add(f"{player_info['name']} @ {player_info['id']}")
-        elif event['event_type'] == EventType.PLAYER_STACKS:
-            stacks = event.get('stacks', {})
-            for player_key in stacks.keys():
-                players.add(player_key)
+    if hand_start_count:
+        print(f"\n第一手牌ID: {first_hand_id}")
+        print(f"最后一手牌ID: {last_hand_id}")
     
     print("\n" + "=" * 80)
     print("玩家统计:")
     print("=" * 80)
     print(f"发现 {len(players)} 位玩家:")
-    for player in sorted(players):
+    for player in sorted(f"{name} @ {player_id}" for name, player_id in players):
         print(f"  - {player}")
     
     print("\n" + "=" * 80)
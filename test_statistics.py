@@ -2,8 +2,17 @@
 测试统计指标计算
 """
 
-from src.storage.json_storage import JSONStorage
-from src.analyzer.statistics import StatisticsCalculator
+import json
+import os
+import sys
+
+from src.storage.json_storage import JSONStorage, ORJSON_AVAILABLE
+from src.analyzer.statistics import StatisticsCalculator, NUMPY_AVAILABLE
+
+if NUMPY_AVAILABLE:
+    import numpy as np
+if ORJSON_AVAILABLE:
+    import orjson
 
 def main():
     print("=" * 100)
@@ -19,9 +28,19 @@ def main():
     # 计算统计指标
     print("\n2. 计算统计指标...")
     calculator = StatisticsCalculator(hands, players)
-    stats = calculator.calculate_all()
+    if '--parallel' in sys.argv:
+        # 多进程按玩家分组计算；数据量小时进程启动开销大于计算本身，默认不开启
+        stats = calculator.calculate_all_parallel(n_jobs=os.cpu_count())
+    else:
+        stats = calculator.calculate_all()
     print(f"   ✓ 计算完成")
     
+    # 列式数组：比率指标按列整体计算
+    if NUMPY_AVAILABLE:
+        arrays = calculator.get_statistics_arrays()
+        print(f"   ✓ 列式统计: {len(arrays)} 位玩家, "
+              f"平均VPIP {arrays.vpip.mean():.1f}%, 平均PFR {arrays.pfr.mean():.1f}%")
+    
     # 显示统计结果
     print("\n3. 统计结果:")
     print()
@@ -75,12 +94,19 @@ def main():
     print("=" * 100)
     print()
     
-    for player_key, stat in stats.items():
-        print(f"{stat.player_name}:")
-        stat_dict = stat.to_dict()
-        for key, value in stat_dict.items():
-            if key not in ['player_key', 'player_name']:
-                print(f"  {key}: {value}")
+    # 一次性编码为缩进JSON输出（键用 player_key，同名不同ID的玩家不会互相覆盖）
+    payload = {
+        player_key: {key: value for key, value in stat.to_dict().items()
+                     if key not in ('player_key', 'player_name')}
+        for player_key, stat in stats.items()
+    }
+    if ORJSON_AVAILABLE:
+        sys.stdout.flush()
+        sys.stdout.buffer.write(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+        sys.stdout.buffer.flush()
+        print("\n")
+    else:
+        print(json.dumps(payload, ensure_ascii=False, indent=2))
         print()
     
     # 比较指标
@@ -89,20 +115,32 @@ def main():
     print("=" * 100)
     print()
     
+    if NUMPY_AVAILABLE:
+        # 在列式数组上用 argmin/argmax 选出玩家，下标与 stats 的顺序一致
+        stat_list = list(stats.values())
+        vpip_key = np.where(arrays.vpip_opportunities > 0, arrays.vpip, 100)
+        af = arrays.af
+        af_key = np.where(np.isinf(af), 0, af)
+        min_vpip = stat_list[int(np.argmin(vpip_key))]
+        max_vpip = stat_list[int(np.argmax(arrays.vpip))]
+        max_af = stat_list[int(np.argmax(af_key))]
+        min_af = stat_list[int(np.argmin(af_key))]
+    else:
+        min_vpip = min(stats.values(), key=lambda s: s.vpip if s.vpip_opportunities > 0 else 100)
+        max_vpip = max(stats.values(), key=lambda s: s.vpip)
+        max_af = max(stats.values(), key=lambda s: s.af if s.af != float('inf') else 0)
+        min_af = min(stats.values(), key=lambda s: s.af if s.af != float('inf') else 0)
+    
     # 找出最紧的玩家
-    min_vpip = min(stats.values(), key=lambda s: s.vpip if s.vpip_opportunities > 0 else 100)
     print(f"最紧玩家（最低VPIP）: {min_vpip.player_name} - {min_vpip.vpip:.1f}%")
     
     # 找出最松的玩家  
-    max_vpip = max(stats.values(), key=lambda s: s.vpip)
     print(f"最松玩家（最高VPIP）: {max_vpip.player_name} - {max_vpip.vpip:.1f}%")
     
     # 找出最激进的玩家
-    max_af = max(stats.values(), key=lambda s: s.af if s.af != float('inf') else 0)
     print(f"最激进玩家（最高AF）: {max_af.player_name} - {max_af.af:.2f}")
     
     # 找出最被动的玩家
-    min_af = min(stats.values(), key=lambda s: s.af if s.af != float('inf') else 0)
     print(f"最被动玩家（最低AF）: {min_af.player_name} - {min_af.af:.2f}")
     
     print("\n" + "=" * 100)
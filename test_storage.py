@@ -6,6 +6,13 @@ from src.parser.log_parser import PokerNowLogParser
 from src.builder.data_builder import DataBuilder
 from src.storage.json_storage import JSONStorage
 import os
+import sys
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
 
 def main():
     print("=" * 80)
@@ -14,11 +21,12 @@ def main():
     print()
     
     # 解析和构建数据
+    # 默认缓存解析结果，基准测试时用 --no-cache 强制重新解析
     print("1. 解析日志文件...")
-    parser = PokerNowLogParser()
-    events = parser.parse_file('poker_now_log_pgleW51Lpe_LURB2EJlJSqety.csv')
-    print(f"   ✓ 解析了 {len(events)} 条事件")
+    parser = PokerNowLogParser(cache_dir=None if '--no-cache' in sys.argv else 'cache')
+    events = parser.iter_events('poker_now_log_pgleW51Lpe_LURB2EJlJSqety.csv')
     
+    # 事件边解析边交给构建器，不保留完整事件列表
     print("\n2. 构建数据模型...")
     builder = DataBuilder()
     hands, players = builder.build_from_events(events)
@@ -29,8 +37,11 @@ def main():
     print("\n3. 保存数据到JSON文件...")
     files = JSONStorage.save_data(hands, players, 'data')
     print("   ✓ 数据已保存:")
+    # 一次遍历输出目录取得所有文件大小
+    with os.scandir('data') as entries:
+        sizes = {entry.name: entry.stat().st_size for entry in entries if entry.is_file()}
     for key, filepath in files.items():
-        filesize = os.path.getsize(filepath) / 1024
+        filesize = sizes[os.path.basename(filepath)] / 1024
         print(f"      - {filepath} ({filesize:.1f} KB)")
     
     # 加载数据
@@ -50,12 +61,24 @@ def main():
     print(f"   ✓ 玩家数量匹配: {len(players)}")
     
     # 验证手牌数据
-    for i, (orig, loaded) in enumerate(zip(hands[:5], loaded_hands[:5])):
-        assert orig.hand_id == loaded.hand_id, f"❌ 手牌{i}的ID不匹配"
-        assert orig.hand_number == loaded.hand_number, f"❌ 手牌{i}的序号不匹配"
-        assert abs(orig.pot_size - loaded.pot_size) < 0.01, f"❌ 手牌{i}的底池不匹配"
-        assert len(orig.players) == len(loaded.players), f"❌ 手牌{i}的玩家数不匹配"
-    print(f"   ✓ 前5手牌数据完整")
+    if NUMPY_AVAILABLE:
+        # 按列整体比较，开销足够小，可以检查全部手牌
+        def columns(key, dtype):
+            return (np.fromiter(map(key, hands), dtype=dtype, count=len(hands)),
+                    np.fromiter(map(key, loaded_hands), dtype=dtype, count=len(loaded_hands)))
+        
+        assert np.array_equal(*columns(lambda h: h.hand_id, object)), "❌ 手牌ID不匹配"
+        assert np.array_equal(*columns(lambda h: h.hand_number, np.int64)), "❌ 手牌序号不匹配"
+        assert np.allclose(*columns(lambda h: h.pot_size, np.float64), rtol=0, atol=0.01), "❌ 底池不匹配"
+        assert np.array_equal(*columns(lambda h: len(h.players), np.int64)), "❌ 手牌玩家数不匹配"
+        print(f"   ✓ 全部 {len(hands)} 手牌数据完整")
+    else:
+        for i, (orig, loaded) in enumerate(zip(hands[:5], loaded_hands[:5])):
+            assert orig.hand_id == loaded.hand_id, f"❌ 手牌{i}的ID不匹配"
+            assert orig.hand_number == loaded.hand_number, f"❌ 手牌{i}的序号不匹配"
+            assert abs(orig.pot_size - loaded.pot_size) < 0.01, f"❌ 手牌{i}的底池不匹配"
+            assert len(orig.players) == len(loaded.players), f"❌ 手牌{i}的玩家数不匹配"
+        print(f"   ✓ 前5手牌数据完整")
     
     # 验证玩家数据
     for player_key in list(players.keys())[:3]:
@@ -75,13 +98,28 @@ def main():
     print(f"\n总手牌数: {len(loaded_hands)}")
     print(f"总玩家数: {len(loaded_players)}")
     
-    total_pot = sum(hand.pot_size for hand in loaded_hands)
+    if NUMPY_AVAILABLE:
+        # 底池列只构造一次，求和/均值在 numpy 中完成
+        pot_sizes = np.fromiter((hand.pot_size for hand in loaded_hands), dtype=np.float64,
+                                count=len(loaded_hands))
+        total_pot = float(pot_sizes.sum())
+        avg_pot = float(pot_sizes.mean())
+    else:
+        total_pot = sum(hand.pot_size for hand in loaded_hands)
+        avg_pot = total_pot / len(loaded_hands)
     print(f"总底池: {total_pot:.1f}")
-    print(f"平均底池: {total_pot/len(loaded_hands):.1f}")
+    print(f"平均底池: {avg_pot:.1f}")
     
     print(f"\n玩家盈亏排名:")
-    sorted_players = sorted(loaded_players.items(), key=lambda x: x[1].total_profit, reverse=True)
-    for player_key, player in sorted_players:
+    player_list = list(loaded_players.values())
+    if NUMPY_AVAILABLE:
+        # 按盈亏从高到低排序；stable 保证盈亏相同时保持原顺序，与 sorted(reverse=True) 一致
+        profits = np.fromiter((player.total_profit for player in player_list), dtype=np.float64,
+                              count=len(player_list))
+        sorted_players = [player_list[i] for i in np.argsort(-profits, kind='stable')]
+    else:
+        sorted_players = sorted(player_list, key=lambda player: player.total_profit, reverse=True)
+    for player in sorted_players:
         profit_str = f"{player.total_profit:+.1f}"
         print(f"  {player.name:15s}: {profit_str:>10s} ({player.hands_played} 手)")
     